@@ -9,6 +9,12 @@ from dotenv import load_dotenv
 import os
 from src.binance_websocket_exchange import BinanceWebSocketExchange
 
+# Prefer uvloop's faster event loop when it is available
+try:
+    from uvloop import run as run_event_loop
+except ImportError:
+    from asyncio import run as run_event_loop
+
 # Load environment variables
 load_dotenv()
 
@@ -54,4 +60,4 @@ async def debug_websocket():
         await exchange.cleanup_open_orders()
 
 if __name__ == "__main__":
-    asyncio.run(debug_websocket())
+    run_event_loop(debug_websocket())
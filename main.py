@@ -6,10 +6,13 @@ A modular framework for testing latency across multiple cryptocurrency exchanges
 Supports Binance and Hyperliquid with extensible architecture for adding more exchanges.
 
 Usage:
-    python main_modular.py [--duration SECONDS]
+    python main.py [--duration SECONDS] [--rate HZ] [--cpus LIST] [--no-flicker]
 
     Options:
         --duration SECONDS    Test duration in seconds (default: unlimited)
+        --rate HZ             Mean tests per second per exchange (default: TEST_RATE_HZ)
+        --cpus LIST           Pin the process to these CPUs, e.g. 2,3 (Linux only)
+        --no-flicker          Force compatibility mode for remote terminals
 
 Configuration:
     Set environment variables in .env file:
@@ -19,11 +22,17 @@ Configuration:
     - LOG_TO_FILE to enable file logging (true/false)
 """
 
-import asyncio
+import os
 import argparse
 from dotenv import load_dotenv
 from src.performance_tester import PerformanceTester
 
+# Prefer uvloop's faster event loop when it is available
+try:
+    from uvloop import run as run_event_loop
+except ImportError:
+    from asyncio import run as run_event_loop
+
 # Load environment variables
 load_dotenv()
 
@@ -35,9 +44,11 @@ def parse_arguments():
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Examples:
-    python main_modular.py                 # Run unlimited time
-    python main_modular.py --duration 60   # Run for 60 seconds
-    python main_modular.py --no-flicker    # Force compatibility mode for remote terminals
+    python main.py                 # Run unlimited time
+    python main.py --duration 60   # Run for 60 seconds
+    python main.py --rate 3        # Start about 3 tests per second per exchange
+    python main.py --cpus 2,3      # Pin to isolated CPUs 2 and 3
+    python main.py --no-flicker    # Force compatibility mode for remote terminals
         """
     )
     
@@ -48,13 +59,40 @@ Examples:
         help='Test duration in seconds (default: unlimited - run until stopped with Ctrl+C)'
     )
     
+    parser.add_argument(
+        '--rate',
+        type=float,
+        default=None,
+        help='Mean tests per second per exchange; gaps between tests are exponentially distributed '
+             '(default: TEST_RATE_HZ from src/config.py)'
+    )
+    
+    parser.add_argument(
+        '--cpus',
+        type=str,
+        default=None,
+        help='Comma-separated CPUs to pin the process to, ideally ones isolated from the scheduler '
+             '(Linux only; default: no pinning)'
+    )
+    
     parser.add_argument(
         '--no-flicker',
         action='store_true',
         help='Force compatibility mode for remote terminals to reduce flickering'
     )
     
-    return parser.parse_args()
+    args = parser.parse_args()
+    if args.rate is not None and args.rate <= 0:
+        parser.error("--rate must be greater than 0")
+    if args.cpus is not None:
+        if not hasattr(os, 'sched_setaffinity'):
+            parser.error("--cpus is only supported on Linux")
+        try:
+            args.cpus = {int(cpu) for cpu in args.cpus.split(',')}
+        except ValueError:
+            parser.error("--cpus must be a comma-separated list of CPU numbers, e.g. 2,3")
+    
+    return args
 
 
 async def main():
@@ -62,8 +100,13 @@ async def main():
     # Parse command line arguments
     args = parse_arguments()
     
+    # Pin before any worker or WebSocket threads start, so they inherit the affinity
+    if args.cpus is not None:
+        os.sched_setaffinity(0, args.cpus)
+    
     # Create performance tester with specified or default duration
-    tester = PerformanceTester(duration_seconds=args.duration, force_compatibility_mode=args.no_flicker)
+    tester = PerformanceTester(duration_seconds=args.duration, force_compatibility_mode=args.no_flicker,
+                               rate_hz=args.rate)
     
     # Run the performance test
     await tester.run_test()
@@ -71,18 +114,8 @@ async def main():
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        run_event_loop(main())
     except KeyboardInterrupt:
         print("\nShutdown requested by user...")
     except Exception as e:
         print(f"Error: {e}")
-    finally:
-        # Ensure all tasks are cancelled on exit
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                pending = asyncio.all_tasks(loop)
-                for task in pending:
-                    task.cancel()
-        except:
-            pass
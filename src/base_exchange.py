@@ -1,7 +1,11 @@
-from typing import Optional
+import time
+import asyncio
+import logging
+from typing import Any, Callable, Optional
 from enum import Enum
 from .models import LatencyData, FailureData
 from .logger import get_logger
+from .config import PRICE_CACHE_TTL, MAX_CONCURRENT_REQUESTS
 
 
 class APIMode(Enum):
@@ -13,17 +17,80 @@ class APIMode(Enum):
 class BaseExchange:
     """Base class for exchange implementations"""
     
-    def __init__(self, name: str, api_mode: APIMode = APIMode.REST):
+    def __init__(self, name: str, api_mode: APIMode = APIMode.REST, order_lock: Optional[asyncio.Lock] = None):
         self.name = name
         self.api_mode = api_mode
         self.full_name = f"{name}-{api_mode.value.upper()}"
         self.latency_data = LatencyData()
         self.failure_data = FailureData()
         self.latest_price = None      # Store latest price for order placement
-        self.open_orders = []         # Track open orders for cleanup
+        self.latest_price_time = 0.0  # Monotonic time of the last price update
+        self.open_orders = {}         # Open orders by ID, tracked for cleanup
+        # Serializes order activity on this account; exchanges sharing an account share the lock
+        self.order_lock = order_lock if order_lock is not None else asyncio.Lock()
+        self.request_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)  # Bounds in-flight HTTP requests
         self.logger = get_logger(f"exchange.{name.lower()}-{api_mode.value}")
         
     
+    @staticmethod
+    def _timed_call(func: Callable[..., Any], *args, **kwargs) -> tuple[Any, Optional[Exception], int]:
+        """Call func and return its result, any exception it raised and the elapsed nanoseconds
+        
+        Meant to be run via asyncio.to_thread so the timing covers only the
+        blocking call, not the hop to and from the worker thread. Exceptions are
+        returned rather than raised so failures are timed the same way as successes.
+        """
+        start_time = time.perf_counter_ns()
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            return None, e, time.perf_counter_ns() - start_time
+        return result, None, time.perf_counter_ns() - start_time
+    
+    def traceback_enabled(self) -> bool:
+        """Whether error logs on the order path should format a full traceback
+        
+        Formatting one costs far more than the log line itself, and the order
+        path logs every failed request, so tracebacks are kept to DEBUG runs.
+        """
+        return self.logger.isEnabledFor(logging.DEBUG)
+    
+    async def _fetch_price(self) -> Optional[float]:
+        """Fetch the current market price - to be implemented by subclasses"""
+        raise NotImplementedError
+    
+    async def _ensure_fresh_price(self) -> bool:
+        """Refresh the cached price once it is older than PRICE_CACHE_TTL
+        
+        Runs before the timed region of a test, so order latency never includes
+        the price lookup. Returns False if no usable price is available.
+        """
+        if self.latest_price and time.monotonic() - self.latest_price_time < PRICE_CACHE_TTL:
+            return True
+        
+        try:
+            price = await self._fetch_price()
+        except Exception as e:
+            self.logger.error(f"Error getting current price: {e}")
+            price = None
+        
+        if price:
+            self.latest_price = price
+            self.latest_price_time = time.monotonic()
+            self.logger.debug("Updated current price: %s", self.latest_price)
+            return True
+        
+        if self.latest_price:
+            self.logger.warning(f"Using last known price: {self.latest_price}")
+            return True
+        
+        self.logger.error("Failed to get current price")
+        return False
+    
+    async def warmup(self) -> None:
+        """Prepare connections before timing starts - optional for subclasses"""
+        pass
+    
     async def test_order_latency(self) -> None:
         """Test order placement and cancellation latency"""
         raise NotImplementedError
@@ -31,3 +98,7 @@ class BaseExchange:
     async def cleanup_open_orders(self):
         """Cancel all open orders - to be implemented by subclasses"""
         raise NotImplementedError
+    
+    async def close(self) -> None:
+        """Release sessions and connections at shutdown - optional for subclasses"""
+        pass
@@ -1,146 +1,221 @@
 import time
-import json
 import asyncio
-from binance.spot import Spot
+import weakref
+import orjson
+from yarl import URL
 from binance.websocket.spot.websocket_stream import SpotWebsocketStreamClient
 from binance.error import ClientError, ServerError
 from websocket import WebSocketTimeoutException
 from .base_exchange import BaseExchange, APIMode
-from .config import BINANCE_CONFIG, ORDER_SIZE_BTC, MARKET_OFFSET
+from .binance_pricing import BinancePricing
+from .binance_signing import HmacSigner, SignedSpot
+from .http_session import get_shared_session
+from .config import BINANCE_CONFIG, BINANCE_ORDER_ERRORS, BINANCE_UNKNOWN_ORDER, ORDER_SIZE_BTC, MARKET_OFFSET
 
 
-class BinanceExchange(BaseExchange):
+def cancel_leaked_orders(client: SignedSpot, symbol: str, open_orders: dict, logger, owner: str) -> None:
+    """Emergency synchronous cancel of orders still tracked when an exchange goes away
+    
+    Registered with weakref.finalize rather than run from __del__, so it holds no
+    reference to the exchange and also runs at interpreter exit. Normally close()
+    has already emptied open_orders and this returns immediately.
+    """
+    if not open_orders:
+        return
+    
+    logger.warning(f"{owner} finalizer: {len(open_orders)} orders still open, attempting cleanup")
+    
+    for order in list(open_orders.values()):
+        try:
+            cancel_response = client.cancel_order(symbol=symbol, orderId=order['id'])
+            
+            if cancel_response and 'orderId' in cancel_response:
+                open_orders.pop(order['id'], None)
+                logger.warning(f"Finalizer cancelled order {order['id']}")
+            
+        except ClientError as e:
+            if e.error_code == BINANCE_UNKNOWN_ORDER:
+                open_orders.pop(order['id'], None)
+            else:
+                logger.error(f"Finalizer cleanup failed for order {order['id']}: {e}")
+        except Exception as e:
+            logger.error(f"Finalizer cleanup failed for order {order['id']}: {e}")
+
+
+class BinanceExchange(BinancePricing, BaseExchange):
     """Binance REST API implementation using official binance-connector for spot trading"""
     
-    def __init__(self, api_key: str, api_secret: str, symbol: str | None = None):
-        super().__init__("Binance-Spot", APIMode.REST)
+    CLOCK_REANCHOR_NS = 60_000_000_000
+    
+    def __init__(self, api_key: str, api_secret: str, symbol: str | None = None,
+                 order_lock: asyncio.Lock | None = None):
+        super().__init__("Binance-Spot", APIMode.REST, order_lock)
         
         self.logger.info("Initializing Binance exchange for spot trading using official connector")
         
         self.api_key = api_key
         self.api_secret = api_secret
         self.symbol = symbol or BINANCE_CONFIG['symbol']
+        self.base_url = BINANCE_CONFIG['base_url']
+        self.api_endpoint = BINANCE_CONFIG['api_endpoint']
+        
+        # HMAC keyed once with the API secret; each signature copies this state
+        self._signer = HmacSigner(self.api_secret)
+        
+        # Account headers sent with every request over the process-wide session
+        self._headers = {
+            'X-MBX-APIKEY': self.api_key,
+            'Content-Type': 'application/x-www-form-urlencoded'
+        }
+        
+        # Parsed endpoint URLs, so aiohttp doesn't re-parse the URL string per request
+        self._urls: dict[str, URL] = {}
         
-        # Initialize Binance Spot client with official connector
-        self.client = Spot(
+        # Synchronous client, only used for emergency cleanup from the finalizer
+        self.client = SignedSpot(
             api_key=self.api_key,
             api_secret=self.api_secret,
             base_url=BINANCE_CONFIG['base_url'],
             timeout=10  # 10 second timeout
         )
+        self._finalizer = weakref.finalize(self, cancel_leaked_orders, self.client, self.symbol,
+                                           self.open_orders, self.logger, "BinanceExchange")
         
         # WebSocket client for orderbook streaming
         self.ws_client = None
         
+        # Constant part of the signed order payload; only price and timestamp vary per order
+        self._order_quantity = self._format_quantity(ORDER_SIZE_BTC)
+        self._place_prefix = (f"symbol={self.symbol}&side=BUY&type=LIMIT&timeInForce=GTC"
+                              f"&quantity={self._order_quantity}&price=").encode('utf-8')
+        self._cancel_prefix = f"symbol={self.symbol}&orderId=".encode('utf-8')
+        
+        # Wall clock anchored to the monotonic clock for request timestamps
+        self._anchor_clock()
+        
         self.logger.info("Binance REST client initialized successfully")
     
-    def _get_tick_size(self, price: float) -> float:
-        """Get tick size for BTCUSDT on Binance Spot"""
-        if price >= BINANCE_CONFIG['tick_threshold']:
-            return BINANCE_CONFIG['tick_size_high']
-        else:
-            return BINANCE_CONFIG['tick_size_low']
+    def _generate_signature(self, payload: bytes) -> str:
+        """Generate HMAC-SHA256 signature for an encoded query string"""
+        return self._signer.sign(payload)
     
-    def _round_to_tick_size(self, price: float) -> float:
-        """Round price to the nearest valid tick size"""
-        tick_size = self._get_tick_size(price)
-        return round(price / tick_size) * tick_size
+    def _anchor_clock(self) -> None:
+        """Pair the current wall-clock time with the current perf counter reading"""
+        self._clock_perf_ns = time.perf_counter_ns()
+        self._clock_wall_ms = time.time_ns() // 1_000_000
     
-    def _format_quantity(self, quantity: float) -> str:
-        """Format quantity with correct precision for spot trading"""
-        precision = BINANCE_CONFIG['quantity_precision']
-        
-        # Start with precise formatting
-        formatted = f"{quantity:.{precision}f}"
+    def _now_ms(self) -> int:
+        """Millisecond timestamp for signed requests
         
-        # For spot trading, we can be flexible with trailing zeros
-        formatted = formatted.rstrip('0').rstrip('.')
-        
-        # Final safety check
-        if not formatted or formatted == '0' or float(formatted) <= 0:
-            min_quantity = 10 ** (-precision)
-            formatted = f"{min_quantity:.{precision}f}"
-            self.logger.warning(f"Quantity {quantity} too small, using minimum: {formatted}")
-        
-        self.logger.debug(f"Formatted quantity {quantity} to {formatted} with precision {precision}")
-        return formatted
+        Advances with the perf counter from the last wall-clock anchor, so an NTP
+        step mid-run can't push timestamps backwards out of recvWindow. Re-anchors
+        once a minute to pick up long-term drift.
+        """
+        elapsed_ns = time.perf_counter_ns() - self._clock_perf_ns
+        if elapsed_ns >= self.CLOCK_REANCHOR_NS:
+            self._anchor_clock()
+            elapsed_ns = 0
+        return self._clock_wall_ms + elapsed_ns // 1_000_000
+    
+    def _sign_payload(self, payload: bytes) -> bytes:
+        """Append the signature to an encoded query string"""
+        return payload + b"&signature=" + self._generate_signature(payload).encode('ascii')
     
-    def _format_price(self, price: float) -> str:
-        """Format price with correct precision for spot trading"""
-        precision = BINANCE_CONFIG['price_precision']
-        formatted = f"{price:.{precision}f}"
+    async def _request(self, method: str, path: str, params: dict | None = None,
+                       body: bytes | None = None) -> dict:
+        """Send a REST request over the shared session
         
-        # Remove trailing zeros after decimal point but keep at least the required precision
-        if '.' in formatted:
-            formatted = formatted.rstrip('0')
-            # Ensure we maintain minimum precision (don't remove all decimal places)
-            decimal_part = formatted.split('.')[1] if '.' in formatted else ''
-            if len(decimal_part) < 2:  # Ensure at least 2 decimal places for prices
-                formatted = f"{price:.2f}"
+        Public endpoints take query params. Signed endpoints take a form body
+        already signed with _sign_payload. At most MAX_CONCURRENT_REQUESTS run at
+        once, so bursts like cleanup queue here instead of failing on connection
+        or rate limits. Errors are raised as the connector's ClientError/ServerError
+        so callers can keep handling Binance API errors the same way.
+        """
+        url = self._urls.get(path)
+        if url is None:
+            url = self._urls[path] = URL(f"{self.base_url}{path}")
         
-        self.logger.debug(f"Formatted price {price} to {formatted} with precision {precision}")
-        return formatted
+        session = get_shared_session()
+        async with self.request_semaphore, session.request(method, url, params=params, data=body,
+                                                           headers=self._headers) as response:
+            raw = await response.read()
+            
+            if response.status >= 500:
+                raise ServerError(response.status, raw.decode('utf-8', 'replace'))
+            if response.status >= 400:
+                try:
+                    error = orjson.loads(raw)
+                except orjson.JSONDecodeError:
+                    raise ClientError(response.status, None, raw.decode('utf-8', 'replace'), response.headers)
+                raise ClientError(response.status, error.get('code'), error.get('msg'),
+                                  response.headers, error.get('data'))
+            
+            return orjson.loads(raw)
+    
+    def _cancel_body(self, order_id: int) -> bytes:
+        """Build the signed cancel body from the precomputed prefix"""
+        payload = self._cancel_prefix + f"{order_id}&timestamp={self._now_ms()}".encode('utf-8')
+        return self._sign_payload(payload)
+    
+    async def warmup(self) -> None:
+        """Open a pooled connection and seed the price before timed requests start"""
+        try:
+            await self._request('GET', '/api/v3/ping', {})
+            await self._ensure_fresh_price()
+            self.logger.info(f"Connection pool warmed up, current price: {self.latest_price}")
+        except Exception as e:
+            self.logger.warning(f"Warmup failed, first samples may include connection setup: {e}")
+    
+    async def _fetch_price(self) -> float | None:
+        """Get current market price from the ticker"""
+        ticker = await self._request('GET', '/api/v3/ticker/price', {'symbol': self.symbol})
+        if ticker and 'price' in ticker:
+            return float(ticker['price'])
+        return None
     
     async def test_order_latency(self) -> None:
         """Test Binance order placement and cancellation latency using official connector"""
-        # Get current market price from ticker
-        if not self.latest_price:
-            try:
-                ticker = self.client.ticker_price(symbol=self.symbol)
-                if ticker and 'price' in ticker:
-                    self.latest_price = float(ticker['price'])
-                    self.logger.debug(f"Got current price from ticker: {self.latest_price}")
-                else:
-                    self.logger.error("Failed to get current price from ticker")
-                    return
-            except Exception as e:
-                self.logger.error(f"Error getting current price: {e}")
-                return
+        # Get current market price, refreshed outside the timed region
+        if not await self._ensure_fresh_price():
+            return
         
+        # Round in integer ticks so the price string is exact
         raw_price = self.latest_price * MARKET_OFFSET  # 5% below market
-        price = self._round_to_tick_size(raw_price)
+        formatted_price = self._format_price_ticks(self._price_to_ticks(raw_price))
         
-        self.logger.debug(f"Placing order: {ORDER_SIZE_BTC} {self.symbol} at {price}")
+        quantity = self._order_quantity
         
+        self.logger.debug("Placing order: %s %s at %s", ORDER_SIZE_BTC, self.symbol, formatted_price)
+        self.logger.debug("Order parameters: symbol=%s, quantity=%s, price=%s, side=BUY, type=LIMIT",
+                          self.symbol, quantity, formatted_price)
+        
+        # Nothing but the request itself runs between here and the latency reading
         self.failure_data.place_order_total += 1
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         
         try:
-            # Format order parameters
-            quantity = self._format_quantity(ORDER_SIZE_BTC)
-            formatted_price = self._format_price(price)
-            
-            self.logger.debug(f"Order parameters: symbol={self.symbol}, "
-                             f"quantity={quantity}, price={formatted_price}, "
-                             f"side=BUY, type=LIMIT")
+            # Place order over the shared session, patching only price and timestamp
+            # into the precomputed payload
+            payload = self._place_prefix + f"{formatted_price}&timestamp={self._now_ms()}".encode('utf-8')
+            order_response = await self._request('POST', self.api_endpoint, body=self._sign_payload(payload))
             
-            # Place order using official connector
-            order_response = self.client.new_order(
-                symbol=self.symbol,
-                side="BUY",
-                type="LIMIT",
-                quantity=quantity,
-                price=formatted_price,
-                timeInForce="GTC"
-            )
-            
-            place_latency = time.time() - start_time
+            place_latency_ns = time.perf_counter_ns() - start_time
             
             # Always record total request latency
-            self.latency_data.place_order_total.append(place_latency)
+            self.latency_data.place_order_total.append(place_latency_ns)
             
             if order_response and 'orderId' in order_response:
                 # Record success-only latency
-                self.latency_data.place_order.append(place_latency)
+                self.latency_data.place_order.append(place_latency_ns)
                 
-                order_id = str(order_response['orderId'])
-                self.logger.debug(f"Order placed successfully in {place_latency:.4f}s, ID: {order_id}")
+                order_id = order_response['orderId']
+                self.logger.debug("Order placed successfully in %.4fs, ID: %s", place_latency_ns / 1e9, order_id)
                 
-                self.open_orders.append({
+                self.open_orders[order_id] = {
                     'id': order_id,
                     'symbol': self.symbol,
                     'exchange': 'binance'
-                })
+                }
                 
                 # Cancel order immediately
                 await self._cancel_order(order_id)
@@ -149,160 +224,118 @@ class BinanceExchange(BaseExchange):
                 self.logger.error(f"Order placement failed: Invalid response {order_response}")
                         
         except (ClientError, ServerError) as e:
-            place_latency = time.time() - start_time
-            self.latency_data.place_order_total.append(place_latency)
+            place_latency_ns = time.perf_counter_ns() - start_time
+            self.latency_data.place_order_total.append(place_latency_ns)
             self.failure_data.place_order_failures += 1
             
-            # Handle specific Binance API errors
-            error_msg = str(e)
-            
-            # Extract error code from the error message if present
-            if "-1111" in error_msg or "precision" in error_msg.lower():
-                self.logger.error(f"PRECISION ERROR - Order placement failed: {error_msg}")
-                self.logger.error(f"PRECISION ERROR - Order parameters: "
+            # Name known Binance API errors by their error code (ServerError has none)
+            error_code = getattr(e, 'error_code', None)
+            label = BINANCE_ORDER_ERRORS.get(error_code, "BINANCE API ERROR")
+            self.logger.error(f"{label} - Order placement failed: {e}")
+            if error_code == -1111:
+                self.logger.error(f"{label} - Order parameters: "
                                f"quantity={quantity}, price={formatted_price}, symbol={self.symbol}")
-            elif "-2010" in error_msg or "insufficient" in error_msg.lower():
-                self.logger.error(f"INSUFFICIENT FUNDS - Order placement failed: {error_msg}")
-            elif "-1013" in error_msg or "filter" in error_msg.lower():
-                self.logger.error(f"FILTER FAILURE - Order placement failed: {error_msg}")
-            else:
-                self.logger.error(f"BINANCE API ERROR - Order placement failed: {error_msg}")
         
         except (TimeoutError, WebSocketTimeoutException) as e:
-            place_latency = time.time() - start_time
-            self.latency_data.place_order_total.append(place_latency)
+            place_latency_ns = time.perf_counter_ns() - start_time
+            self.latency_data.place_order_total.append(place_latency_ns)
             self.failure_data.place_order_failures += 1
             self.logger.error(f"TIMEOUT ERROR - Order placement failed: {e}")
             
         except Exception as e:
-            place_latency = time.time() - start_time
-            self.latency_data.place_order_total.append(place_latency)
+            place_latency_ns = time.perf_counter_ns() - start_time
+            self.latency_data.place_order_total.append(place_latency_ns)
             self.failure_data.place_order_failures += 1
             
-            # Handle other errors
-            error_msg = str(e)
-            if "precision" in error_msg.lower():
-                self.logger.error(f"PRECISION ERROR - Order placement failed: {e}")
-                self.logger.error(f"PRECISION ERROR - Order parameters: "
-                               f"quantity={quantity}, price={formatted_price}, symbol={self.symbol}")
-            else:
-                self.logger.error(f"Order placement error: {e}", exc_info=True)
+            # Binance API errors are handled above; anything here is unexpected
+            self.logger.error(f"Order placement error: {e}", exc_info=self.traceback_enabled())
     
-    async def _cancel_order(self, order_id: str) -> None:
-        """Cancel a specific order using official connector"""
+    async def _cancel_order(self, order_id: int) -> None:
+        """Cancel a specific order over the shared session"""
         self.failure_data.cancel_order_total += 1
-        cancel_start_time = time.time()
+        cancel_start_time = time.perf_counter_ns()
         
         try:
-            # Cancel order using official connector
-            cancel_response = self.client.cancel_order(
-                symbol=self.symbol,
-                orderId=int(order_id)
-            )
+            cancel_response = await self._request('DELETE', self.api_endpoint, body=self._cancel_body(order_id))
             
-            cancel_latency = time.time() - cancel_start_time
+            cancel_latency_ns = time.perf_counter_ns() - cancel_start_time
             
             # Always record total cancel latency
-            self.latency_data.cancel_order_total.append(cancel_latency)
+            self.latency_data.cancel_order_total.append(cancel_latency_ns)
             
             if cancel_response and 'orderId' in cancel_response:
                 # Record success-only cancel latency
-                self.latency_data.cancel_order.append(cancel_latency)
-                self.open_orders = [o for o in self.open_orders if o['id'] != order_id]
-                self.logger.debug(f"Order {order_id} cancelled successfully in {cancel_latency:.4f}s")
+                self.latency_data.cancel_order.append(cancel_latency_ns)
+                self.open_orders.pop(order_id, None)
+                self.logger.debug("Order %s cancelled successfully in %.4fs", order_id, cancel_latency_ns / 1e9)
             else:
                 self.failure_data.cancel_order_failures += 1
                 self.logger.error(f"Order cancellation failed for {order_id}: Invalid response {cancel_response}")
                 
         except (ClientError, ServerError) as e:
-            cancel_latency = time.time() - cancel_start_time
-            self.latency_data.cancel_order_total.append(cancel_latency)
+            cancel_latency_ns = time.perf_counter_ns() - cancel_start_time
+            self.latency_data.cancel_order_total.append(cancel_latency_ns)
             self.failure_data.cancel_order_failures += 1
             
             error_msg = str(e)
-            if "-2011" in error_msg:  # Order not found
+            if getattr(e, 'error_code', None) == BINANCE_UNKNOWN_ORDER:
                 self.logger.warning(f"Order {order_id} not found during cancellation: {error_msg}")
                 # Remove from open orders list since it doesn't exist
-                self.open_orders = [o for o in self.open_orders if o['id'] != order_id]
+                self.open_orders.pop(order_id, None)
             else:
                 self.logger.error(f"Binance API error cancelling order {order_id}: {error_msg}")
                 
         except (TimeoutError, WebSocketTimeoutException) as e:
-            cancel_latency = time.time() - cancel_start_time
-            self.latency_data.cancel_order_total.append(cancel_latency)
+            cancel_latency_ns = time.perf_counter_ns() - cancel_start_time
+            self.latency_data.cancel_order_total.append(cancel_latency_ns)
             self.failure_data.cancel_order_failures += 1
             self.logger.error(f"TIMEOUT ERROR - Order cancellation failed for {order_id}: {e}")
             
         except Exception as e:
-            cancel_latency = time.time() - cancel_start_time
-            self.latency_data.cancel_order_total.append(cancel_latency)
+            cancel_latency_ns = time.perf_counter_ns() - cancel_start_time
+            self.latency_data.cancel_order_total.append(cancel_latency_ns)
             self.failure_data.cancel_order_failures += 1
-            self.logger.error(f"Error cancelling order {order_id}: {e}", exc_info=True)
+            self.logger.error(f"Error cancelling order {order_id}: {e}", exc_info=self.traceback_enabled())
+    
+    async def _cleanup_order(self, order: dict) -> None:
+        """Cancel one tracked order during cleanup and stop tracking it once it's gone"""
+        try:
+            cancel_response = await self._request('DELETE', self.api_endpoint,
+                                                  body=self._cancel_body(order['id']))
+            
+            if cancel_response and 'orderId' in cancel_response:
+                self.open_orders.pop(order['id'], None)
+                self.logger.info(f"Successfully cancelled order {order['id']} during cleanup")
+            else:
+                self.logger.warning(f"Failed to cancel order {order['id']} during cleanup: Invalid response")
+                
+        except (ClientError, ServerError) as e:
+            error_msg = str(e)
+            if getattr(e, 'error_code', None) == BINANCE_UNKNOWN_ORDER:
+                self.logger.info(f"Order {order['id']} already cancelled or filled during cleanup")
+                self.open_orders.pop(order['id'], None)
+            else:
+                self.logger.error(f"Binance API error during cleanup of order {order['id']}: {error_msg}")
+        except Exception as e:
+            self.logger.error(f"Error during cleanup of order {order['id']}: {e}", exc_info=True)
     
     async def cleanup_open_orders(self):
-        """Cancel all open Binance orders using official connector"""
+        """Cancel all open Binance orders over the shared session"""
         if not self.open_orders:
             self.logger.info("No open orders to cleanup")
             return
         
         self.logger.info(f"Cleaning up {len(self.open_orders)} open orders")
         
-        for order in self.open_orders[:]:
-            try:
-                cancel_response = self.client.cancel_order(
-                    symbol=self.symbol,
-                    orderId=int(order['id'])
-                )
-                
-                if cancel_response and 'orderId' in cancel_response:
-                    self.open_orders.remove(order)
-                    self.logger.info(f"Successfully cancelled order {order['id']} during cleanup")
-                else:
-                    self.logger.warning(f"Failed to cancel order {order['id']} during cleanup: Invalid response")
-                    
-            except (ClientError, ServerError) as e:
-                error_msg = str(e)
-                if "-2011" in error_msg:  # Order not found
-                    self.logger.info(f"Order {order['id']} already cancelled or filled during cleanup")
-                    self.open_orders.remove(order)
-                else:
-                    self.logger.error(f"Binance API error during cleanup of order {order['id']}: {error_msg}")
-            except Exception as e:
-                self.logger.error(f"Error during cleanup of order {order['id']}: {e}", exc_info=True)
+        # Cancels are independent, so overlap them on the pooled session
+        await asyncio.gather(*(self._cleanup_order(order) for order in list(self.open_orders.values())),
+                             return_exceptions=True)
         
         if self.open_orders:
             self.logger.warning(f"Failed to cleanup {len(self.open_orders)} orders")
         else:
             self.logger.info("All orders cleaned up successfully")
     
-    def __del__(self):
-        """Destructor to ensure cleanup when object is garbage collected"""
-        try:
-            if hasattr(self, 'open_orders') and self.open_orders:
-                self.logger.warning(f"BinanceExchange destructor: {len(self.open_orders)} orders still open, attempting cleanup")
-                
-                # Emergency synchronous cleanup
-                for order in self.open_orders[:]:
-                    try:
-                        cancel_response = self.client.cancel_order(
-                            symbol=self.symbol,
-                            orderId=int(order['id'])
-                        )
-                        
-                        if cancel_response and 'orderId' in cancel_response:
-                            self.open_orders.remove(order)
-                            self.logger.warning(f"Destructor cancelled order {order['id']}")
-                        
-                    except Exception as e:
-                        error_msg = str(e)
-                        if "-2011" in error_msg:  # Order not found
-                            self.open_orders.remove(order)
-                        else:
-                            self.logger.error(f"Destructor cleanup failed for order {order['id']}: {e}")
-        except Exception as e:
-            # Avoid exceptions in destructor
-            pass
-
     async def close(self):
         """Close connection and cleanup resources"""
         try:
@@ -0,0 +1,45 @@
+from .config import BINANCE_CONFIG
+
+# Tick schedule resolved once at import, so pricing an order does no config lookups
+TICK_THRESHOLD = BINANCE_CONFIG['tick_threshold']
+TICK_SIZE_HIGH = BINANCE_CONFIG['tick_size_high']
+TICK_SIZE_LOW = BINANCE_CONFIG['tick_size_low']
+PRICE_PRECISION = BINANCE_CONFIG['price_precision']
+PRICE_SCALE = 10 ** PRICE_PRECISION
+TICK_UNITS_HIGH = round(TICK_SIZE_HIGH * PRICE_SCALE)
+TICK_UNITS_LOW = round(TICK_SIZE_LOW * PRICE_SCALE)
+QUANTITY_PRECISION = BINANCE_CONFIG['quantity_precision']
+
+
+class BinancePricing:
+    """Price and quantity formatting shared by the Binance REST and WebSocket exchanges
+
+    Expects the host class to provide self.logger.
+    """
+
+    def _price_to_ticks(self, price: float) -> int:
+        """Convert a price to integer units of the price precision, rounded to the tick size"""
+        if price >= TICK_THRESHOLD:
+            return round(price / TICK_SIZE_HIGH) * TICK_UNITS_HIGH
+        return round(price / TICK_SIZE_LOW) * TICK_UNITS_LOW
+
+    def _format_price_ticks(self, units: int) -> str:
+        """Format an integer tick price for the API without float formatting"""
+        return f"{units // PRICE_SCALE}.{units % PRICE_SCALE:0{PRICE_PRECISION}d}"
+
+    def _format_quantity(self, quantity: float) -> str:
+        """Format quantity with correct precision for spot trading"""
+        # Start with precise formatting
+        formatted = f"{quantity:.{QUANTITY_PRECISION}f}"
+
+        # For spot trading, we can be flexible with trailing zeros
+        formatted = formatted.rstrip('0').rstrip('.')
+
+        # Final safety check
+        if not formatted or formatted == '0' or float(formatted) <= 0:
+            min_quantity = 10 ** (-QUANTITY_PRECISION)
+            formatted = f"{min_quantity:.{QUANTITY_PRECISION}f}"
+            self.logger.warning(f"Quantity {quantity} too small, using minimum: {formatted}")
+
+        self.logger.debug("Formatted quantity %s to %s with precision %s", quantity, formatted, QUANTITY_PRECISION)
+        return formatted
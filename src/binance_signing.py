@@ -0,0 +1,53 @@
+import ssl
+import hmac
+import hashlib
+from requests.adapters import HTTPAdapter
+from binance.spot import Spot
+from .config import MAX_CONCURRENT_REQUESTS
+from .logger import get_logger
+
+# hashlib.sha256 comes from OpenSSL, which picks SHA-NI or the ARMv8 SHA2
+# instructions at runtime, unless Python was built without it and fell back
+# to the portable _sha256 module
+OPENSSL_SHA256 = hashlib.sha256.__name__ == 'openssl_sha256'
+
+
+class HmacSigner:
+    """HMAC-SHA256 request signer keyed once with the API secret
+
+    hmac.new re-derives the inner and outer key pads on every call; copying a
+    pre-keyed object skips that setup for each signature.
+    """
+
+    def __init__(self, api_secret: str):
+        logger = get_logger("binance_signing")
+        if OPENSSL_SHA256:
+            logger.debug("Request signing uses HMAC-SHA256 from %s", ssl.OPENSSL_VERSION)
+        else:
+            logger.warning("hashlib is not backed by OpenSSL; request signing will use the slower built-in SHA-256")
+        self._template = hmac.new(api_secret.encode('utf-8'), None, hashlib.sha256)
+
+    def sign(self, payload: bytes) -> str:
+        """Return the hex signature for an encoded query string"""
+        signer = self._template.copy()
+        signer.update(payload)
+        return signer.hexdigest()
+
+
+class SignedSpot(Spot):
+    """Spot REST client that signs HMAC requests with a pre-keyed signer
+
+    The connector's requests session keeps at most 10 idle connections per host,
+    so bursts of threaded cancels beyond that would open (and then discard) fresh
+    TLS connections. The pool is sized to the request concurrency limit instead.
+    """
+
+    def __init__(self, api_key=None, api_secret=None, **kwargs):
+        super().__init__(api_key=api_key, api_secret=api_secret, **kwargs)
+        self._signer = HmacSigner(api_secret) if api_secret else None
+        self.session.mount('https://', HTTPAdapter(pool_maxsize=MAX_CONCURRENT_REQUESTS, max_retries=0))
+
+    def _get_sign(self, payload):
+        if self.private_key is not None or self._signer is None:
+            return super()._get_sign(payload)
+        return self._signer.sign(payload.encode('utf-8'))
@@ -0,0 +1,93 @@
+from urllib.parse import urlencode
+import orjson
+from websocket import ABNF, create_connection
+from binance.lib.utils import get_timestamp, get_uuid, purge_map
+from binance.websocket.binance_socket_manager import BinanceSocketManager
+from binance.websocket.spot.websocket_api import SpotWebsocketAPIClient
+from .binance_signing import HmacSigner
+
+
+class LowLatencySocketManager(BinanceSocketManager):
+    """Socket manager tuned for the order path of the WebSocket API"""
+
+    def create_ws_connection(self):
+        """Open the connection without per-frame UTF-8 validation
+
+        Binance only sends small JSON text frames, and websocket-client's
+        validation is a pure-Python loop over every byte unless wsaccel is
+        installed, which runs on the reader thread ahead of every response.
+        """
+        self.logger.debug("Creating connection with WebSocket Server: %s", self.stream_url)
+
+        self.ws = create_connection(
+            self.stream_url,
+            timeout=self.timeout,
+            skip_utf8_validation=True,
+            **self._proxy_params
+        )
+
+        self.logger.debug("WebSocket connection has been established: %s", self.stream_url)
+        self._callback(self.on_open)
+
+    def _handle_data(self, op_code, frame, data):
+        """Pass text frames to on_message as raw bytes
+
+        The message handler parses with orjson, which accepts bytes directly,
+        so decoding every frame to str first is a wasted copy.
+        """
+        if op_code == ABNF.OPCODE_TEXT:
+            self._callback(self.on_message, frame.data)
+
+
+class LowLatencyWebsocketAPIClient(SpotWebsocketAPIClient):
+    """Spot WebSocket API client using the low-latency socket manager
+
+    Order placement and cancellation are signed with a pre-keyed HMAC instead of
+    the connector's websocket_api_signature, which re-keys HMAC for every request.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._signer = HmacSigner(self.api_secret) if self.api_key and self.api_secret else None
+
+    def _send_signed(self, method: str, parameters: dict):
+        """Sign parameters the way websocket_api_signature does and send the request"""
+        request_id = parameters.pop("id", None) or get_uuid()
+        parameters["timestamp"] = get_timestamp()
+        parameters["apiKey"] = self.api_key
+
+        # The WebSocket API signs the parameters sorted by name
+        parameters = dict(sorted(parameters.items()))
+        parameters["signature"] = self._signer.sign(urlencode(parameters).encode('utf-8'))
+
+        self.send({"id": request_id, "method": method, "params": parameters})
+
+    def new_order(self, symbol: str, side: str, type: str, **kwargs):
+        if self._signer is None:
+            return super().new_order(symbol, side, type, **kwargs)
+        self._send_signed("order.place", purge_map({"symbol": symbol, "side": side, "type": type, **kwargs}))
+
+    def cancel_order(self, symbol: str, **kwargs):
+        if self._signer is None:
+            return super().cancel_order(symbol, **kwargs)
+        self._send_signed("order.cancel", purge_map({"symbol": symbol, **kwargs}))
+
+    def send(self, message: dict):
+        """Serialize requests with orjson and send them as UTF-8 text frames"""
+        self.socket_manager.send_message(orjson.dumps(message))
+
+    def _initialize_socket(self, stream_url, on_message, on_open, on_close, on_error,
+                           on_ping, on_pong, logger, timeout, time_unit, proxies):
+        return LowLatencySocketManager(
+            stream_url,
+            on_message=on_message,
+            on_open=on_open,
+            on_close=on_close,
+            on_error=on_error,
+            on_ping=on_ping,
+            on_pong=on_pong,
+            logger=logger,
+            timeout=timeout,
+            time_unit=time_unit,
+            proxies=proxies,
+        )
@@ -1,135 +1,175 @@
 import time
 import asyncio
 import socket
-import json
-import threading
-from binance.spot import Spot
-from binance.websocket.spot.websocket_api import SpotWebsocketAPIClient
+import orjson
+import itertools
+import weakref
 from binance.error import ClientError, ServerError
 from websocket import WebSocketTimeoutException, WebSocketConnectionClosedException
 from .base_exchange import BaseExchange, APIMode
-from .config import BINANCE_CONFIG, ORDER_SIZE_BTC, MARKET_OFFSET, WEBSOCKET_TIMEOUT, MAX_RECONNECT_ATTEMPTS, RECONNECT_BASE_DELAY
+from .binance_exchange import cancel_leaked_orders
+from .binance_pricing import BinancePricing
+from .binance_signing import SignedSpot
+from .binance_websocket_client import LowLatencyWebsocketAPIClient
+from .config import BINANCE_CONFIG, BINANCE_ORDER_ERRORS, BINANCE_UNKNOWN_ORDER, ORDER_SIZE_BTC, MARKET_OFFSET, WEBSOCKET_TIMEOUT, MAX_RECONNECT_ATTEMPTS, RECONNECT_BASE_DELAY, MAX_CONCURRENT_WS_REQUESTS
 
 
-class BinanceWebSocketExchange(BaseExchange):
+class BinanceWebSocketExchange(BinancePricing, BaseExchange):
     """Binance WebSocket API implementation using official binance-connector for spot trading"""
     
-    def __init__(self, api_key: str, secret_key: str):
-        super().__init__("Binance-Spot", APIMode.WEBSOCKET)
+    def __init__(self, api_key: str, secret_key: str, order_lock: asyncio.Lock | None = None):
+        super().__init__("Binance-Spot", APIMode.WEBSOCKET, order_lock)
         
         self.logger.info("Initializing Binance WebSocket exchange for spot trading using official connector")
         
         self.api_key = api_key
         self.secret_key = secret_key
         self.symbol = BINANCE_CONFIG['symbol']
+        self._order_quantity = self._format_quantity(ORDER_SIZE_BTC)
         
         # Response handling for WebSocket API
-        self.pending_requests = {}  # Track pending requests by ID
-        self.request_counter = 0    # Generate unique request IDs
-        self.request_lock = threading.Lock()  # Thread-safe request ID generation
+        self.pending_requests = {}  # Pending response futures keyed by request ID
+        self.request_ids = itertools.count(1)  # Monotonic request IDs
+        self.loop = None  # Event loop that owns the pending futures
         
         # Initialize Binance WebSocket API client for order operations
-        self.ws_client = SpotWebsocketAPIClient(
+        self.ws_client = self._create_ws_client()
+        
+        # Shared REST client for price lookups and fallback cleanup, so every REST
+        # call reuses the same pooled keep-alive connection
+        self.rest_client = SignedSpot(
             api_key=self.api_key,
             api_secret=self.secret_key,
-            stream_url="wss://ws-api.binance.com:443/ws-api/v3",
-            timeout=WEBSOCKET_TIMEOUT,
-            on_message=self._handle_websocket_message
+            base_url=BINANCE_CONFIG['base_url'],
+            timeout=10
         )
+        self._finalizer = weakref.finalize(self, cancel_leaked_orders, self.rest_client, self.symbol,
+                                           self.open_orders, self.logger, "BinanceWebSocketExchange")
         
         # Stream client for orderbook data (unused in current implementation)
         self.stream_client = None
         
         # Connection state and health monitoring
         self.is_connected = False
-        self.last_successful_operation = time.time()
+        self.last_successful_operation = time.monotonic()
         self.connection_health_task = None
         self.connection_failures = 0
         self.max_connection_failures = 5
         
         # Connection recovery state
         self.recovery_in_progress = False
-        self.last_recovery_attempt = 0
+        self.last_recovery_attempt = float('-inf')
         self.recovery_cooldown = 2.0  # Reduced to 2 seconds for more frequent operations
         
+        # Only one task may tear down and reopen the connection at a time
+        self.reconnect_lock = asyncio.Lock()
+        # Cleanup cancels fan out over the WebSocket, so they get their own limit
+        # rather than borrowing the HTTP request semaphore
+        self.ws_request_semaphore = asyncio.Semaphore(MAX_CONCURRENT_WS_REQUESTS)
+        
         self.logger.info("Binance WebSocket API client initialized successfully")
 
+    def _create_ws_client(self) -> LowLatencyWebsocketAPIClient:
+        """Open a new WebSocket API connection"""
+        return LowLatencyWebsocketAPIClient(
+            api_key=self.api_key,
+            api_secret=self.secret_key,
+            stream_url="wss://ws-api.binance.com:443/ws-api/v3",
+            timeout=WEBSOCKET_TIMEOUT,
+            on_message=self._handle_websocket_message
+        )
+
+    def _ws_is_open(self) -> bool:
+        """Check whether the current WebSocket connection is still usable"""
+        if not self.ws_client:
+            return False
+        socket_manager = self.ws_client.socket_manager
+        return socket_manager.is_alive() and socket_manager.ws.connected
+
+    def _current_ws_client(self) -> LowLatencyWebsocketAPIClient:
+        """Snapshot the WebSocket client for a send, since a reconnect may replace it mid-call"""
+        ws_client = self.ws_client
+        if ws_client is None:
+            raise ConnectionError("WebSocket client is disconnected")
+        return ws_client
+
     def _handle_websocket_message(self, _, message):
-        """Handle incoming WebSocket messages from Binance API with proper response correlation"""
+        """Handle incoming WebSocket messages from Binance API with proper response correlation
+        
+        WebSocket API responses always have the shape {"id", "status", "result" | "error"},
+        so the handler resolves the pending request straight from the ID.
+        """
         try:
-            if isinstance(message, str):
-                data = json.loads(message)
-            else:
-                data = message
-            
-            self.logger.debug(f"Received WebSocket message: {data}")
+            data = orjson.loads(message)
+            self.logger.debug("Received WebSocket message: %s", data)
             
-            # Handle response to our requests
-            if 'id' in data:
-                request_id = data['id']
-                if request_id in self.pending_requests:
-                    # Store the response and signal the waiting event
-                    self.pending_requests[request_id]['response'] = data
-                    self.pending_requests[request_id]['event'].set()
-                    self.logger.debug(f"Response received for request {request_id}: status={data.get('status', 'unknown')}")
-                else:
-                    self.logger.warning(f"Received response for unknown request ID: {request_id}")
+            # Messages arrive on the connector's thread, so hand the response
+            # to the event loop that owns the waiting future
+            future = self.pending_requests.get(data.get('id'))
+            if future is not None:
+                self.loop.call_soon_threadsafe(self._resolve_request, future, data)
+            elif 'id' in data:
+                self.logger.warning(f"Received response for unknown request ID: {data['id']}")
             else:
                 # Handle stream data or other messages
-                self.logger.debug(f"Received non-request message: {data}")
+                self.logger.debug("Received non-request message: %s", data)
                 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             self.logger.error(f"Failed to parse WebSocket message: {e}")
         except Exception as e:
             self.logger.error(f"Error handling WebSocket message: {e}")
 
-    def _generate_request_id(self) -> str:
-        """Generate a unique request ID for WebSocket requests"""
-        with self.request_lock:
-            self.request_counter += 1
-            return f"req_{int(time.time())}_{self.request_counter}"
+    @staticmethod
+    def _resolve_request(future: asyncio.Future, response: dict):
+        """Complete a pending request future on the event loop thread"""
+        if not future.done():
+            future.set_result(response)
+
+    def _register_request(self) -> tuple[int, asyncio.Future]:
+        """Allocate a request ID and the future its response will resolve"""
+        self.loop = asyncio.get_running_loop()
+        request_id = next(self.request_ids)
+        future = self.loop.create_future()
+        self.pending_requests[request_id] = future
+        return request_id, future
 
     async def _place_order_websocket(self, symbol: str, side: str, type: str, 
-                                   quantity: float, price: float, timeInForce: str = "GTC"):
-        """Place an order using Binance WebSocket API with proper response handling"""
+                                   quantity: str, price: str, timeInForce: str = "GTC"):
+        """Place an order using Binance WebSocket API with proper response handling
+        
+        Quantity and price are passed through as already-formatted strings.
+        """
+        request_id = None
         try:
-            request_id = self._generate_request_id()
-            
-            # Store the request for response correlation
-            response_event = asyncio.Event()
-            self.pending_requests[request_id] = {
-                'event': response_event,
-                'response': None,
-                'timestamp': time.time()
-            }
+            # Register the request for response correlation
+            request_id, response_future = self._register_request()
             
-            self.logger.debug(f"Placing WebSocket order with ID {request_id}: {symbol} {side} {quantity} @ {price}")
+            self.logger.debug("Placing WebSocket order with ID %s: %s %s %s @ %s", request_id, symbol, side, quantity, price)
             
             # Use the binance-connector's built-in new_order method with custom ID
             # Call directly instead of using executor to avoid threading issues
-            self.ws_client.new_order(
+            self._current_ws_client().new_order(
                 id=request_id,
                 symbol=symbol,
                 side=side,
                 type=type,
-                quantity=str(quantity),
-                price=str(price),
+                quantity=quantity,
+                price=price,
                 timeInForce=timeInForce
             )
             
             # Wait for response with timeout (increased from 10s to 20s for better reliability)
             try:
-                await asyncio.wait_for(response_event.wait(), timeout=20.0)
-                response = self.pending_requests[request_id]['response']
+                response = await asyncio.wait_for(response_future, timeout=20.0)
                 
                 if response and response.get('status') == 200 and 'result' in response:
-                    self.logger.debug(f"WebSocket order placement succeeded: {response['result']}")
+                    self.logger.debug("WebSocket order placement succeeded: %s", response['result'])
                     return response['result']
                 elif response and 'error' in response:
                     error = response['error']
                     self.logger.error(f"WebSocket order placement error: {error}")
-                    # Create a formatted error response similar to REST API
-                    raise Exception(f"({error.get('code', 'unknown')}, {error.get('msg', 'Unknown error')})")
+                    # Raise the same error type as the REST API
+                    raise ClientError(response.get('status'), error.get('code'), error.get('msg'), {})
                 else:
                     self.logger.error(f"WebSocket order placement failed: Invalid response {response}")
                     raise Exception("Invalid response None")
@@ -139,7 +179,7 @@ class BinanceWebSocketExchange(BaseExchange):
                 
                 # CRITICAL FIX: When WebSocket times out, the order might still be placed!
                 # Query for recent orders to find and cancel any orphaned orders
-                await self._handle_websocket_timeout_order_placement(quantity, price)
+                await self._handle_websocket_timeout_order_placement(float(quantity), float(price))
                 
                 raise Exception("WebSocket order placement timeout")
                 
@@ -148,24 +188,15 @@ class BinanceWebSocketExchange(BaseExchange):
             raise
         finally:
             # Clean up pending request
-            if request_id in self.pending_requests:
-                del self.pending_requests[request_id]
+            self.pending_requests.pop(request_id, None)
 
     async def _handle_websocket_timeout_order_placement(self, quantity: float, price: float):
         """Handle potential orphaned orders when WebSocket placement times out"""
         try:
             self.logger.warning("Checking for orphaned orders after WebSocket timeout...")
             
-            # Use REST API to query recent orders
-            from binance.spot import Spot
-            rest_client = Spot(
-                api_key=self.api_key,
-                api_secret=self.secret_key,
-                timeout=5
-            )
-            
-            # Get recent orders for this symbol
-            recent_orders = rest_client.get_orders(symbol=self.symbol, limit=10)
+            # Use REST API to query recent orders for this symbol
+            recent_orders = await asyncio.to_thread(self.rest_client.get_orders, symbol=self.symbol, limit=10)
             
             # Look for orders placed in the last 30 seconds with matching parameters
             current_time = time.time() * 1000  # Convert to milliseconds
@@ -183,15 +214,15 @@ class BinanceWebSocketExchange(BaseExchange):
                         abs(order_price - price) < 0.01 and 
                         order_status in ['NEW', 'PARTIALLY_FILLED']):
                         
-                        order_id = str(order['orderId'])
+                        order_id = order['orderId']
                         self.logger.warning(f"Found potential orphaned order {order_id} with qty={order_qty}, price={order_price}")
                         
                         # Add to open orders list for tracking
-                        self.open_orders.append({
+                        self.open_orders[order_id] = {
                             'id': order_id,
                             'symbol': self.symbol,
                             'exchange': 'binance'
-                        })
+                        }
                         
                         # Try to cancel immediately
                         try:
@@ -205,22 +236,16 @@ class BinanceWebSocketExchange(BaseExchange):
 
     async def _cancel_order_websocket(self, symbol: str, orderId: int):
         """Cancel an order using Binance WebSocket API with proper response handling"""
+        request_id = None
         try:
-            request_id = self._generate_request_id()
-            
-            # Store the request for response correlation
-            response_event = asyncio.Event()
-            self.pending_requests[request_id] = {
-                'event': response_event,
-                'response': None,
-                'timestamp': time.time()
-            }
+            # Register the request for response correlation
+            request_id, response_future = self._register_request()
             
-            self.logger.debug(f"Cancelling WebSocket order with ID {request_id}: {orderId}")
+            self.logger.debug("Cancelling WebSocket order with ID %s: %s", request_id, orderId)
             
             # Use the binance-connector's built-in cancel_order method with custom ID
             # Call directly instead of using executor to avoid threading issues
-            self.ws_client.cancel_order(
+            self._current_ws_client().cancel_order(
                 id=request_id,
                 symbol=symbol,
                 orderId=orderId
@@ -228,17 +253,16 @@ class BinanceWebSocketExchange(BaseExchange):
             
             # Wait for response with timeout (increased from 10s to 15s for better reliability)
             try:
-                await asyncio.wait_for(response_event.wait(), timeout=15.0)
-                response = self.pending_requests[request_id]['response']
+                response = await asyncio.wait_for(response_future, timeout=15.0)
                 
                 if response and response.get('status') == 200 and 'result' in response:
-                    self.logger.debug(f"WebSocket order cancellation succeeded: {response['result']}")
+                    self.logger.debug("WebSocket order cancellation succeeded: %s", response['result'])
                     return response['result']
                 elif response and 'error' in response:
                     error = response['error']
                     self.logger.error(f"WebSocket order cancellation error: {error}")
-                    # Create a formatted error response similar to REST API
-                    raise Exception(f"({error.get('code', 'unknown')}, {error.get('msg', 'Unknown error')})")
+                    # Raise the same error type as the REST API
+                    raise ClientError(response.get('status'), error.get('code'), error.get('msg'), {})
                 else:
                     self.logger.error(f"WebSocket order cancellation failed: Invalid response {response}")
                     raise Exception("Invalid response None")
@@ -252,15 +276,22 @@ class BinanceWebSocketExchange(BaseExchange):
             raise
         finally:
             # Clean up pending request
-            if request_id in self.pending_requests:
-                del self.pending_requests[request_id]
+            self.pending_requests.pop(request_id, None)
 
     async def connect(self):
         """Establish WebSocket connection with enhanced retry logic and health monitoring"""
         if self.recovery_in_progress:
             self.logger.debug("Connection attempt skipped - recovery already in progress")
             return
-            
+        
+        async with self.reconnect_lock:
+            # Another task may have reconnected while this one waited for the lock
+            if self.is_connected and self._ws_is_open():
+                return
+            await self._connect()
+
+    async def _connect(self):
+        """Connect with retries; the caller must hold reconnect_lock"""
         max_retries = 5
         retry_delays = [1, 2, 5, 10, 15]  # Progressive delays
         
@@ -268,24 +299,20 @@ class BinanceWebSocketExchange(BaseExchange):
             try:
                 self.logger.info(f"WebSocket connection attempt {attempt + 1}/{max_retries}")
                 
-                # Close any existing connections first
-                await self._force_disconnect()
-                
-                # Always create a fresh WebSocket client to ensure proper message handling
-                self.ws_client = SpotWebsocketAPIClient(
-                    api_key=self.api_key,
-                    api_secret=self.secret_key,
-                    stream_url="wss://ws-api.binance.com:443/ws-api/v3",
-                    timeout=WEBSOCKET_TIMEOUT,
-                    on_message=self._handle_websocket_message
-                )
+                if self._ws_is_open():
+                    # Keep the live connection rather than paying for a new handshake
+                    self.logger.info("Reusing existing WebSocket connection")
+                else:
+                    # Close any stale connections and open a fresh one
+                    await self._force_disconnect()
+                    self.ws_client = self._create_ws_client()
                 
                 # Test the connection with a simple ping-like operation
                 await self._test_connection()
                 
                 self.is_connected = True
                 self.connection_failures = 0
-                self.last_successful_operation = time.time()
+                self.last_successful_operation = time.monotonic()
                 self.logger.info(f"WebSocket connection established successfully on attempt {attempt + 1}")
                 
                 # Start connection health monitoring
@@ -311,18 +338,28 @@ class BinanceWebSocketExchange(BaseExchange):
                         self.logger.error("Too many connection failures - WebSocket mode may be unstable")
 
     async def _test_connection(self):
-        """Test the WebSocket connection with a lightweight operation"""
+        """Test the WebSocket connection with a ping round trip over the open socket"""
+        request_id = None
         try:
-            # Test with account information request (lightweight)
-            test_start = time.time()
-            # For now, we'll just assume the connection is good if the client initializes
-            # The actual test would be done when we perform operations
-            await asyncio.sleep(0.1)  # Small delay to simulate connection test
-            test_time = time.time() - test_start
-            self.logger.debug(f"Connection test completed in {test_time:.3f}s")
+            request_id, response_future = self._register_request()
+            
+            test_start = time.perf_counter_ns()
+            self._current_ws_client().ping_connectivity(id=request_id)
+            response = await asyncio.wait_for(response_future, timeout=10.0)
+            test_time_ns = time.perf_counter_ns() - test_start
+            
+            if not response or response.get('status') != 200:
+                raise Exception(f"Unexpected ping response: {response}")
+            
+            self.logger.debug("Connection test completed in %.3fs", test_time_ns / 1e9)
+        except asyncio.TimeoutError:
+            self.logger.error("Connection test failed: ping timeout - no response received")
+            raise Exception("WebSocket ping timeout")
         except Exception as e:
             self.logger.error(f"Connection test failed: {e}")
             raise
+        finally:
+            self.pending_requests.pop(request_id, None)
 
     async def _force_disconnect(self):
         """Force disconnect all WebSocket connections"""
@@ -331,13 +368,15 @@ class BinanceWebSocketExchange(BaseExchange):
                 try:
                     self.ws_client.stop()
                 except Exception as e:
-                    self.logger.debug(f"Error stopping WebSocket client: {e}")
+                    self.logger.debug("Error stopping WebSocket client: %s", e)
+                # Drop the stopped client so the next connect opens a new one
+                self.ws_client = None
                     
             if hasattr(self, 'stream_client') and self.stream_client:
                 try:
                     self.stream_client.stop()
                 except Exception as e:
-                    self.logger.debug(f"Error stopping stream client: {e}")
+                    self.logger.debug("Error stopping stream client: %s", e)
                     
             # Cancel health monitoring task
             if self.connection_health_task and not self.connection_health_task.done():
@@ -351,7 +390,7 @@ class BinanceWebSocketExchange(BaseExchange):
             await asyncio.sleep(0.1)  # Brief pause to ensure cleanup
             
         except Exception as e:
-            self.logger.debug(f"Error during force disconnect: {e}")
+            self.logger.debug("Error during force disconnect: %s", e)
 
     async def _monitor_connection_health(self):
         """Monitor WebSocket connection health and trigger recovery if needed"""
@@ -360,7 +399,7 @@ class BinanceWebSocketExchange(BaseExchange):
                 await asyncio.sleep(45)  # Check every 45 seconds (less frequent)
                 
                 # Check if we've had recent successful operations
-                time_since_last_success = time.time() - self.last_successful_operation
+                time_since_last_success = time.monotonic() - self.last_successful_operation
                 
                 if time_since_last_success > 180:  # 3 minutes without success (more lenient)
                     self.logger.warning(f"No successful operations for {time_since_last_success:.1f}s - connection may be stale")
@@ -368,7 +407,7 @@ class BinanceWebSocketExchange(BaseExchange):
                     # Test connection health
                     try:
                         await asyncio.wait_for(self._test_connection(), timeout=15)  # Longer timeout
-                        self.last_successful_operation = time.time()
+                        self.last_successful_operation = time.monotonic()
                     except (asyncio.TimeoutError, Exception) as e:
                         self.logger.error(f"Connection health check failed: {e}")
                         # Only trigger recovery if we haven't had ANY successful operations recently
@@ -393,16 +432,16 @@ class BinanceWebSocketExchange(BaseExchange):
 
     async def _handle_websocket_timeout(self, operation_name: str = "WebSocket operation"):
         """Enhanced WebSocket timeout handling with smarter recovery"""
-        current_time = time.time()
+        current_time = time.monotonic()
         
         # Prevent multiple concurrent recovery attempts
         if self.recovery_in_progress:
-            self.logger.debug(f"Recovery already in progress for {operation_name}")
+            self.logger.debug("Recovery already in progress for %s", operation_name)
             return False
             
         # Implement recovery cooldown to prevent rapid retry loops
         if current_time - self.last_recovery_attempt < self.recovery_cooldown:
-            self.logger.debug(f"Recovery cooldown active, skipping recovery for {operation_name}")
+            self.logger.debug("Recovery cooldown active, skipping recovery for %s", operation_name)
             return False
             
         self.recovery_in_progress = True
@@ -412,39 +451,43 @@ class BinanceWebSocketExchange(BaseExchange):
         self.is_connected = False
         
         try:
-            # Attempt to reconnect with exponential backoff
-            for attempt in range(MAX_RECONNECT_ATTEMPTS):
-                try:
-                    self.logger.info(f"WebSocket recovery attempt {attempt + 1}/{MAX_RECONNECT_ATTEMPTS}")
-                    
-                    # Force close existing connections
-                    await self._force_disconnect()
-                    
-                    # Progressive delay with jitter
-                    base_delay = RECONNECT_BASE_DELAY * (2 ** attempt)
-                    jitter = 0.1 * base_delay * (asyncio.get_event_loop().time() % 1)
-                    delay = base_delay + jitter
-                    
-                    self.logger.debug(f"Waiting {delay:.2f}s before recovery attempt {attempt + 1}")
-                    await asyncio.sleep(delay)
-                    
-                    # Attempt to reconnect
-                    await self.connect()
-                    
-                    if self.is_connected:
-                        self.logger.info(f"WebSocket connection recovered successfully on attempt {attempt + 1}")
-                        self.connection_failures = 0
-                        return True
-                        
-                except Exception as e:
-                    self.logger.warning(f"WebSocket recovery attempt {attempt + 1} failed: {e}")
-                    
-            self.logger.error(f"Failed to recover WebSocket connection after {MAX_RECONNECT_ATTEMPTS} attempts")
-            return False
-            
+            async with self.reconnect_lock:
+                return await self._reconnect_with_backoff()
         finally:
             self.recovery_in_progress = False
 
+    async def _reconnect_with_backoff(self) -> bool:
+        """Reopen the connection with exponential backoff; the caller must hold reconnect_lock"""
+        # Attempt to reconnect with exponential backoff
+        for attempt in range(MAX_RECONNECT_ATTEMPTS):
+            try:
+                self.logger.info(f"WebSocket recovery attempt {attempt + 1}/{MAX_RECONNECT_ATTEMPTS}")
+                
+                # Force close existing connections
+                await self._force_disconnect()
+                
+                # Progressive delay with jitter
+                base_delay = RECONNECT_BASE_DELAY * (2 ** attempt)
+                jitter = 0.1 * base_delay * (asyncio.get_event_loop().time() % 1)
+                delay = base_delay + jitter
+                
+                self.logger.debug("Waiting %.2fs before recovery attempt %s", delay, attempt + 1)
+                await asyncio.sleep(delay)
+                
+                # Attempt to reconnect; this task already holds the lock
+                await self._connect()
+                
+                if self.is_connected:
+                    self.logger.info(f"WebSocket connection recovered successfully on attempt {attempt + 1}")
+                    self.connection_failures = 0
+                    return True
+                    
+            except Exception as e:
+                self.logger.warning(f"WebSocket recovery attempt {attempt + 1} failed: {e}")
+                
+        self.logger.error(f"Failed to recover WebSocket connection after {MAX_RECONNECT_ATTEMPTS} attempts")
+        return False
+
     async def _safe_websocket_operation(self, operation_func, operation_name: str, max_retries: int = 2):
         """Safely execute a WebSocket operation with enhanced timeout handling and recovery"""
         operation_timeout = min(WEBSOCKET_TIMEOUT * 0.8, 20)  # Use 80% of WebSocket timeout or 20s max
@@ -461,17 +504,17 @@ class BinanceWebSocketExchange(BaseExchange):
                         self.logger.warning(f"Connection check failed for {operation_name}, but attempting operation anyway...")
                 
                 # Execute operation with adaptive timeout
-                self.logger.debug(f"Executing {operation_name} with {operation_timeout}s timeout (attempt {attempt + 1})")
+                self.logger.debug("Executing %s with %ss timeout (attempt %s)", operation_name, operation_timeout, attempt + 1)
                 
-                start_time = time.time()
+                start_time = time.monotonic()
                 result = await asyncio.wait_for(operation_func(), timeout=operation_timeout)
                 
                 # Update successful operation timestamp and ensure connection is marked as good
-                self.last_successful_operation = time.time()
+                self.last_successful_operation = time.monotonic()
                 self.is_connected = True  # Mark connection as good after successful operation
                 self.connection_failures = 0  # Reset failure counter
                 operation_time = self.last_successful_operation - start_time
-                self.logger.debug(f"{operation_name} completed successfully in {operation_time:.3f}s")
+                self.logger.debug("%s completed successfully in %.3fs", operation_name, operation_time)
                 
                 return result
                 
@@ -479,7 +522,7 @@ class BinanceWebSocketExchange(BaseExchange):
                     ConnectionError, WebSocketConnectionClosedException, 
                     socket.timeout, OSError) as e:
                     
-                operation_time = time.time() - start_time if 'start_time' in locals() else 0
+                operation_time = time.monotonic() - start_time if 'start_time' in locals() else 0
                 self.logger.error(f"Timeout/Connection error during {operation_name} "
                                 f"(attempt {attempt + 1}, took {operation_time:.3f}s): {type(e).__name__}: {e}")
                 
@@ -510,7 +553,7 @@ class BinanceWebSocketExchange(BaseExchange):
                     raise
                     
             except Exception as e:
-                operation_time = time.time() - start_time if 'start_time' in locals() else 0
+                operation_time = time.monotonic() - start_time if 'start_time' in locals() else 0
                 error_msg = str(e).lower()
                 
                 # Check if it's a connection-related error
@@ -540,75 +583,23 @@ class BinanceWebSocketExchange(BaseExchange):
         # If we get here, all retries failed
         raise ConnectionError(f"All retry attempts failed for {operation_name} after {max_retries + 1} attempts")
 
-    def _get_tick_size(self, price: float) -> float:
-        """Get tick size for BTCUSDT on Binance Spot"""
-        if price >= BINANCE_CONFIG['tick_threshold']:
-            return BINANCE_CONFIG['tick_size_high']
-        else:
-            return BINANCE_CONFIG['tick_size_low']
-
-    def _round_to_tick_size(self, price: float) -> float:
-        """Round price to the nearest valid tick size"""
-        tick_size = self._get_tick_size(price)
-        return round(price / tick_size) * tick_size
-
-    def _format_price(self, price: float) -> str:
-        """Format price according to Binance tick size requirements"""
-        # Binance Spot BTCUSDT has specific tick size requirements
-        # Round price to valid tick size (e.g., 0.1 for BTCUSDT)
-        if price >= BINANCE_CONFIG['tick_threshold']:
-            tick_size = BINANCE_CONFIG['tick_size_high']
-        else:
-            tick_size = BINANCE_CONFIG['tick_size_low']
-        
-        # Round to nearest valid tick
-        rounded_price = round(price / tick_size) * tick_size
-        
-        # Format with appropriate precision for spot trading
-        precision = BINANCE_CONFIG['price_precision']
-        formatted = f"{rounded_price:.{precision}f}"
-        
-        # Remove trailing zeros but maintain minimum precision
-        if '.' in formatted:
-            formatted = formatted.rstrip('0')
-            decimal_part = formatted.split('.')[1] if '.' in formatted else ''
-            if len(decimal_part) < 2:
-                formatted = f"{rounded_price:.2f}"
-        
-        self.logger.debug(f"Formatted price {price} -> {rounded_price} -> {formatted}")
-        return formatted
-
-    def _format_quantity(self, quantity: float) -> str:
-        """Format quantity with correct precision for spot trading"""
-        precision = BINANCE_CONFIG['quantity_precision']
-        
-        # Format with full precision
-        formatted = f"{quantity:.{precision}f}"
-        
-        # Remove trailing zeros
-        formatted = formatted.rstrip('0').rstrip('.')
-        
-        # Ensure we don't have empty string or zero
-        if not formatted or formatted == '0' or float(formatted) <= 0:
-            min_quantity = 10 ** (-precision)
-            formatted = f"{min_quantity:.{precision}f}"
-            self.logger.warning(f"Quantity {quantity} too small, using minimum: {formatted}")
+    async def warmup(self) -> None:
+        """Connect and clear stale orders before timed requests start"""
+        if not self.is_connected:
+            await self.connect()
         
-        self.logger.debug(f"Formatted quantity {quantity} to {formatted}")
-        return formatted
+        # Comprehensive cleanup via REST also opens the pooled REST connection
+        self.logger.info("Starting comprehensive cleanup before order latency tests...")
+        await self.cleanup_all_open_orders_rest()
 
     async def test_order_latency(self) -> None:
         """Test Binance order placement and cancellation latency using WebSocket API"""
-        # First, do a comprehensive cleanup using REST API to ensure clean start
-        self.logger.info("Starting comprehensive cleanup before order latency test...")
-        await self.cleanup_all_open_orders_rest()
-        
-        # Also cleanup any orders in our tracking list
+        # Cleanup any leftover orders in our tracking list
         if self.open_orders:
             self.logger.warning(f"Found {len(self.open_orders)} leftover orders in tracking list, cleaning up")
             await self.cleanup_open_orders()
         
-        self.logger.debug(f"Starting order latency test - Connection status: {self.is_connected}, Failures: {self.connection_failures}")
+        self.logger.debug("Starting order latency test - Connection status: %s, Failures: %s", self.is_connected, self.connection_failures)
         
         try:
             # Wrap the actual test in safe WebSocket operation
@@ -625,73 +616,61 @@ class BinanceWebSocketExchange(BaseExchange):
                 except Exception as cleanup_error:
                     self.logger.error(f"Error during post-test cleanup: {cleanup_error}")
 
+    async def _fetch_price(self) -> float | None:
+        """Get current market price from the REST ticker (the WebSocket order API has no ticker)"""
+        ticker = await asyncio.to_thread(self.rest_client.ticker_price, symbol=self.symbol)
+        if ticker and 'price' in ticker:
+            return float(ticker['price'])
+        return None
+
     async def _test_order_latency_internal(self) -> None:
         """Internal implementation of order latency test using WebSocket API"""
-        # Get current market price from REST API (since WebSocket order API doesn't provide ticker)
-        if not self.latest_price:
-            try:
-                # Use a simple REST client to get current price with timeout
-                from binance.spot import Spot
-                rest_client = Spot(timeout=5)  # Short timeout for price check
-                ticker = rest_client.ticker_price(symbol=self.symbol)
-                if ticker and 'price' in ticker:
-                    self.latest_price = float(ticker['price'])
-                    self.logger.debug(f"Got current price from REST ticker: {self.latest_price}")
-                else:
-                    self.logger.error("Failed to get current price from ticker")
-                    return
-            except Exception as e:
-                self.logger.error(f"Error getting current price: {e}")
-                # Try to continue with last known price if available
-                if hasattr(self, 'latest_price') and self.latest_price:
-                    self.logger.warning(f"Using last known price: {self.latest_price}")
-                else:
-                    return
+        # Get current market price, refreshed outside the timed region
+        if not await self._ensure_fresh_price():
+            return
 
         raw_price = self.latest_price * MARKET_OFFSET  # 5% below market
-        price = self._round_to_tick_size(raw_price)
 
-        self.logger.debug(f"Placing order via WebSocket: {ORDER_SIZE_BTC} {self.symbol} at {price}")
+        # Format order parameters before the timer starts; the quantity never changes
+        formatted_price = self._format_price_ticks(self._price_to_ticks(raw_price))
+        quantity = self._order_quantity
 
+        self.logger.debug("Placing order via WebSocket: %s %s at %s", ORDER_SIZE_BTC, self.symbol, formatted_price)
+        self.logger.debug("Order parameters: symbol=%s, quantity=%s, price=%s, side=BUY, type=LIMIT",
+                          self.symbol, quantity, formatted_price)
+
+        # Nothing but the request itself runs between here and the latency reading
         self.failure_data.place_order_total += 1
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
 
         try:
-            # Format order parameters
-            quantity = self._format_quantity(ORDER_SIZE_BTC)
-            formatted_price = self._format_price(price)
-
-            self.logger.debug(f"Order parameters: symbol={self.symbol}, "
-                             f"quantity={quantity}, price={formatted_price}, "
-                             f"side=BUY, type=LIMIT")
-
             # Use WebSocket API for order placement
             order_response = await self._place_order_websocket(
                 symbol=self.symbol,
                 side="BUY",
                 type="LIMIT",
-                quantity=float(quantity),
-                price=float(formatted_price),
+                quantity=quantity,
+                price=formatted_price,
                 timeInForce="GTC"
             )
 
-            place_latency = time.time() - start_time
+            place_latency_ns = time.perf_counter_ns() - start_time
 
             # Always record total request latency
-            self.latency_data.place_order_total.append(place_latency)
+            self.latency_data.place_order_total.append(place_latency_ns)
 
             if order_response and 'orderId' in order_response:
                 # Record success-only latency
-                self.latency_data.place_order.append(place_latency)
+                self.latency_data.place_order.append(place_latency_ns)
 
-                order_id = str(order_response['orderId'])
-                self.logger.debug(f"Order placed successfully via WebSocket in {place_latency:.4f}s, ID: {order_id}")
+                order_id = order_response['orderId']
+                self.logger.debug("Order placed successfully via WebSocket in %.4fs, ID: %s", place_latency_ns / 1e9, order_id)
 
-                self.open_orders.append({
+                self.open_orders[order_id] = {
                     'id': order_id,
                     'symbol': self.symbol,
                     'exchange': 'binance'
-                })
+                }
 
                 # Cancel order immediately with timeout
                 try:
@@ -706,41 +685,44 @@ class BinanceWebSocketExchange(BaseExchange):
                 self.logger.error(f"WebSocket order placement failed: Invalid response {order_response}")
 
         except (TimeoutError, WebSocketTimeoutException, asyncio.TimeoutError, socket.timeout) as e:
-            place_latency = time.time() - start_time
-            self.latency_data.place_order_total.append(place_latency)
+            place_latency_ns = time.perf_counter_ns() - start_time
+            self.latency_data.place_order_total.append(place_latency_ns)
             self.failure_data.place_order_failures += 1
-            self.logger.error(f"TIMEOUT ERROR - Order placement failed after {place_latency:.3f}s: {type(e).__name__}: {e}")
+            self.logger.error(f"TIMEOUT ERROR - Order placement failed after {place_latency_ns / 1e9:.3f}s: {type(e).__name__}: {e}")
             # Mark connection as potentially problematic
             self.connection_failures += 1
             # Re-raise to trigger recovery in _safe_websocket_operation
             raise
 
         except (ConnectionError, WebSocketConnectionClosedException, OSError) as e:
-            place_latency = time.time() - start_time
-            self.latency_data.place_order_total.append(place_latency)
+            place_latency_ns = time.perf_counter_ns() - start_time
+            self.latency_data.place_order_total.append(place_latency_ns)
             self.failure_data.place_order_failures += 1
-            self.logger.error(f"CONNECTION ERROR - Order placement failed after {place_latency:.3f}s: {type(e).__name__}: {e}")
+            self.logger.error(f"CONNECTION ERROR - Order placement failed after {place_latency_ns / 1e9:.3f}s: {type(e).__name__}: {e}")
             self.connection_failures += 1
             # Re-raise to trigger recovery
             raise
 
-        except Exception as e:
-            place_latency = time.time() - start_time
-            self.latency_data.place_order_total.append(place_latency)
+        except ClientError as e:
+            place_latency_ns = time.perf_counter_ns() - start_time
+            self.latency_data.place_order_total.append(place_latency_ns)
             self.failure_data.place_order_failures += 1
 
-            # Handle specific API errors
-            error_msg = str(e)
-            if "-1111" in error_msg or "precision" in error_msg.lower():
-                self.logger.error(f"PRECISION ERROR - Order placement failed: {error_msg}")
+            # Name known API errors by their error code; these are not connection issues
+            label = BINANCE_ORDER_ERRORS.get(e.error_code, "API ERROR")
+            self.logger.error(f"{label} - Order placement failed: {e}")
+            if e.error_code == -1111:
                 self.logger.error(f"Order parameters: "
                                f"quantity={quantity}, price={formatted_price}, symbol={self.symbol}")
-            elif "-2010" in error_msg or "insufficient" in error_msg.lower():
-                self.logger.error(f"INSUFFICIENT FUNDS - Order placement failed: {error_msg}")
-            elif "-1013" in error_msg or "filter" in error_msg.lower():
-                self.logger.error(f"FILTER FAILURE - Order placement failed: {error_msg}")
-            elif "timeout" in error_msg.lower() or "timed out" in error_msg.lower():
-                self.logger.error(f"API TIMEOUT - Order placement failed after {place_latency:.3f}s: {error_msg}")
+
+        except Exception as e:
+            place_latency_ns = time.perf_counter_ns() - start_time
+            self.latency_data.place_order_total.append(place_latency_ns)
+            self.failure_data.place_order_failures += 1
+
+            error_msg = str(e)
+            if "timeout" in error_msg.lower() or "timed out" in error_msg.lower():
+                self.logger.error(f"API TIMEOUT - Order placement failed after {place_latency_ns / 1e9:.3f}s: {error_msg}")
                 self.connection_failures += 1
                 # Re-raise timeout errors to trigger recovery
                 raise asyncio.TimeoutError(f"API timeout: {error_msg}")
@@ -748,69 +730,78 @@ class BinanceWebSocketExchange(BaseExchange):
                 self.logger.error(f"API ERROR - Order placement failed: {error_msg}")
                 # Don't re-raise general API errors as they're not connection issues
 
-    async def _cancel_order(self, order_id: str) -> None:
+    async def _cancel_order(self, order_id: int) -> None:
         """Cancel a specific order using WebSocket API with timeout handling"""
         await self._safe_websocket_operation(
             lambda: self._cancel_order_internal(order_id),
             f"cancel order {order_id}"
         )
 
-    async def _cancel_order_internal(self, order_id: str) -> None:
+    async def _cancel_order_internal(self, order_id: int) -> None:
         """Internal implementation of order cancellation using WebSocket API"""
         self.failure_data.cancel_order_total += 1
-        cancel_start_time = time.time()
+        cancel_start_time = time.perf_counter_ns()
 
         try:
             # Use WebSocket API for cancellation
             cancel_response = await self._cancel_order_websocket(
                 symbol=self.symbol,
-                orderId=int(order_id)
+                orderId=order_id
             )
 
-            cancel_latency = time.time() - cancel_start_time
+            cancel_latency_ns = time.perf_counter_ns() - cancel_start_time
 
             # Always record total cancel latency
-            self.latency_data.cancel_order_total.append(cancel_latency)
+            self.latency_data.cancel_order_total.append(cancel_latency_ns)
 
             if cancel_response and 'orderId' in cancel_response:
                 # Record success-only cancel latency
-                self.latency_data.cancel_order.append(cancel_latency)
-                self.open_orders = [o for o in self.open_orders if o['id'] != order_id]
-                self.logger.debug(f"Order {order_id} cancelled successfully via WebSocket in {cancel_latency:.4f}s")
+                self.latency_data.cancel_order.append(cancel_latency_ns)
+                self.open_orders.pop(order_id, None)
+                self.logger.debug("Order %s cancelled successfully via WebSocket in %.4fs", order_id, cancel_latency_ns / 1e9)
             else:
                 self.failure_data.cancel_order_failures += 1
                 self.logger.error(f"WebSocket order cancellation failed for {order_id}: Invalid response {cancel_response}")
 
         except (TimeoutError, WebSocketTimeoutException, asyncio.TimeoutError, socket.timeout) as e:
-            cancel_latency = time.time() - cancel_start_time
-            self.latency_data.cancel_order_total.append(cancel_latency)
+            cancel_latency_ns = time.perf_counter_ns() - cancel_start_time
+            self.latency_data.cancel_order_total.append(cancel_latency_ns)
             self.failure_data.cancel_order_failures += 1
-            self.logger.error(f"TIMEOUT ERROR - WebSocket order cancellation failed for {order_id} after {cancel_latency:.3f}s: {type(e).__name__}: {e}")
+            self.logger.error(f"TIMEOUT ERROR - WebSocket order cancellation failed for {order_id} after {cancel_latency_ns / 1e9:.3f}s: {type(e).__name__}: {e}")
             self.connection_failures += 1
             # Re-raise to trigger recovery in _safe_websocket_operation
             raise
 
         except (ConnectionError, WebSocketConnectionClosedException, OSError) as e:
-            cancel_latency = time.time() - cancel_start_time
-            self.latency_data.cancel_order_total.append(cancel_latency)
+            cancel_latency_ns = time.perf_counter_ns() - cancel_start_time
+            self.latency_data.cancel_order_total.append(cancel_latency_ns)
             self.failure_data.cancel_order_failures += 1
-            self.logger.error(f"CONNECTION ERROR - WebSocket order cancellation failed for {order_id} after {cancel_latency:.3f}s: {type(e).__name__}: {e}")
+            self.logger.error(f"CONNECTION ERROR - WebSocket order cancellation failed for {order_id} after {cancel_latency_ns / 1e9:.3f}s: {type(e).__name__}: {e}")
             self.connection_failures += 1
             # Re-raise to trigger recovery
             raise
 
+        except ClientError as e:
+            cancel_latency_ns = time.perf_counter_ns() - cancel_start_time
+            self.latency_data.cancel_order_total.append(cancel_latency_ns)
+            self.failure_data.cancel_order_failures += 1
+
+            if e.error_code == BINANCE_UNKNOWN_ORDER:
+                self.logger.warning(f"Order {order_id} not found during WebSocket cancellation (likely already filled/cancelled): {e}")
+                # Remove from open orders list since it doesn't exist
+                self.open_orders.pop(order_id, None)
+            else:
+                self.logger.error(f"API ERROR - WebSocket order cancellation failed for {order_id}: {e}")
+                # Don't re-raise API errors as they're not connection issues
+
         except Exception as e:
-            cancel_latency = time.time() - cancel_start_time
-            self.latency_data.cancel_order_total.append(cancel_latency)
+            cancel_latency_ns = time.perf_counter_ns() - cancel_start_time
+            self.latency_data.cancel_order_total.append(cancel_latency_ns)
             self.failure_data.cancel_order_failures += 1
 
             error_msg = str(e)
-            if "-2011" in error_msg:  # Order not found
-                self.logger.warning(f"Order {order_id} not found during WebSocket cancellation (likely already filled/cancelled): {error_msg}")
-                # Remove from open orders list since it doesn't exist
-                self.open_orders = [o for o in self.open_orders if o['id'] != order_id]
-            elif "timeout" in error_msg.lower() or "timed out" in error_msg.lower():
-                self.logger.error(f"API TIMEOUT - WebSocket order cancellation failed for {order_id} after {cancel_latency:.3f}s: {error_msg}")
+            if "timeout" in error_msg.lower() or "timed out" in error_msg.lower():
+                self.logger.error(f"API TIMEOUT - WebSocket order cancellation failed for {order_id} after {cancel_latency_ns / 1e9:.3f}s: {error_msg}")
                 self.connection_failures += 1
                 # Re-raise timeout errors to trigger recovery
                 raise asyncio.TimeoutError(f"API timeout: {error_msg}")
@@ -838,28 +829,20 @@ class BinanceWebSocketExchange(BaseExchange):
             self.logger.info(f"Found {len(open_orders)} open orders for {symbol}, cancelling all...")
             
             # Cancel all orders using the bulk cancel operation
-            request_id = self._generate_request_id()
-            
-            # Store the request for response correlation
-            response_event = asyncio.Event()
-            self.pending_requests[request_id] = {
-                'event': response_event,
-                'response': None,
-                'timestamp': time.time()
-            }
+            # Register the request for response correlation
+            request_id, response_future = self._register_request()
             
-            self.logger.debug(f"Cancelling all orders with ID {request_id} for symbol: {symbol}")
+            self.logger.debug("Cancelling all orders with ID %s for symbol: %s", request_id, symbol)
             
             # Use the binance-connector's built-in cancel_open_orders method
-            self.ws_client.cancel_open_orders(
+            self._current_ws_client().cancel_open_orders(
                 id=request_id,
                 symbol=symbol
             )
             
             # Wait for response with timeout
             try:
-                await asyncio.wait_for(response_event.wait(), timeout=20.0)
-                response = self.pending_requests[request_id]['response']
+                response = await asyncio.wait_for(response_future, timeout=20.0)
                 
                 if response and response.get('status') == 200 and 'result' in response:
                     cancelled_orders = response['result']
@@ -868,7 +851,7 @@ class BinanceWebSocketExchange(BaseExchange):
                 elif response and 'error' in response:
                     error = response['error']
                     self.logger.error(f"WebSocket cancel all orders error: {error}")
-                    raise Exception(f"({error.get('code', 'unknown')}, {error.get('msg', 'Unknown error')})")
+                    raise ClientError(response.get('status'), error.get('code'), error.get('msg'), {})
                 else:
                     self.logger.error(f"WebSocket cancel all orders failed: Invalid response {response}")
                     raise Exception("Invalid response for cancel all orders")
@@ -882,8 +865,7 @@ class BinanceWebSocketExchange(BaseExchange):
             raise
         finally:
             # Clean up pending request
-            if request_id and request_id in self.pending_requests:
-                del self.pending_requests[request_id]
+            self.pending_requests.pop(request_id, None)
 
     async def _get_open_orders_websocket(self, symbol: str | None = None):
         """Get all open orders for a symbol using WebSocket API"""
@@ -895,37 +877,29 @@ class BinanceWebSocketExchange(BaseExchange):
         
         request_id = None
         try:
-            request_id = self._generate_request_id()
+            # Register the request for response correlation
+            request_id, response_future = self._register_request()
             
-            # Store the request for response correlation
-            response_event = asyncio.Event()
-            self.pending_requests[request_id] = {
-                'event': response_event,
-                'response': None,
-                'timestamp': time.time()
-            }
-            
-            self.logger.debug(f"Getting open orders with ID {request_id} for symbol: {symbol}")
+            self.logger.debug("Getting open orders with ID %s for symbol: %s", request_id, symbol)
             
             # Use the binance-connector's built-in get_open_orders method
-            self.ws_client.get_open_orders(
+            self._current_ws_client().get_open_orders(
                 id=request_id,
                 symbol=symbol
             )
             
             # Wait for response with timeout
             try:
-                await asyncio.wait_for(response_event.wait(), timeout=15.0)
-                response = self.pending_requests[request_id]['response']
+                response = await asyncio.wait_for(response_future, timeout=15.0)
                 
                 if response and response.get('status') == 200 and 'result' in response:
                     orders = response['result']
-                    self.logger.debug(f"Retrieved {len(orders)} open orders for {symbol}")
+                    self.logger.debug("Retrieved %s open orders for %s", len(orders), symbol)
                     return orders
                 elif response and 'error' in response:
                     error = response['error']
                     self.logger.error(f"WebSocket get open orders error: {error}")
-                    raise Exception(f"({error.get('code', 'unknown')}, {error.get('msg', 'Unknown error')})")
+                    raise ClientError(response.get('status'), error.get('code'), error.get('msg'), {})
                 else:
                     self.logger.error(f"WebSocket get open orders failed: Invalid response {response}")
                     raise Exception("Invalid response for get open orders")
@@ -939,8 +913,7 @@ class BinanceWebSocketExchange(BaseExchange):
             raise
         finally:
             # Clean up pending request
-            if request_id and request_id in self.pending_requests:
-                del self.pending_requests[request_id]
+            self.pending_requests.pop(request_id, None)
 
     async def place_multiple_orders_websocket(self, orders_config: list):
         """Place multiple orders sequentially using WebSocket API"""
@@ -951,14 +924,14 @@ class BinanceWebSocketExchange(BaseExchange):
         
         for i, order_config in enumerate(orders_config):
             try:
-                self.logger.debug(f"Placing order {i+1}/{len(orders_config)}: {order_config}")
+                self.logger.debug("Placing order %s/%s: %s", i+1, len(orders_config), order_config)
                 
                 result = await self._place_order_websocket(
                     symbol=order_config.get('symbol', self.symbol),
                     side=order_config['side'],
                     type=order_config.get('type', 'LIMIT'),
-                    quantity=order_config['quantity'],
-                    price=order_config['price'],
+                    quantity=str(order_config['quantity']),
+                    price=str(order_config['price']),
                     timeInForce=order_config.get('timeInForce', 'GTC')
                 )
                 
@@ -1005,9 +978,9 @@ class BinanceWebSocketExchange(BaseExchange):
             if cancelled_orders:
                 self.logger.info(f"Successfully cancelled {len(cancelled_orders)} orders via bulk WebSocket operation")
                 
-                # Update our tracking list - remove cancelled orders
-                cancelled_order_ids = {str(order.get('orderId', '')) for order in cancelled_orders}
-                self.open_orders = [order for order in self.open_orders if order['id'] not in cancelled_order_ids]
+                # Update our tracking - remove cancelled orders
+                for order in cancelled_orders:
+                    self.open_orders.pop(order.get('orderId'), None)
                 
                 # If all orders were cancelled, we're done
                 if not self.open_orders:
@@ -1017,25 +990,10 @@ class BinanceWebSocketExchange(BaseExchange):
         except Exception as e:
             self.logger.warning(f"Bulk WebSocket cancel failed: {e}, falling back to individual cancellation")
         
-        # Fallback: Try individual WebSocket cancellation for remaining orders
-        failed_orders = []
-        for order in self.open_orders[:]:
-            try:
-                # Use WebSocket API for cleanup with shorter timeout
-                await asyncio.wait_for(self._cancel_order(order['id']), timeout=5.0)
-                self.logger.info(f"Successfully cancelled order {order['id']} during cleanup via WebSocket")
-                    
-            except asyncio.TimeoutError:
-                self.logger.warning(f"WebSocket timeout cancelling order {order['id']}, will retry with REST API")
-                failed_orders.append(order)
-            except Exception as e:
-                error_msg = str(e)
-                if "-2011" in error_msg:  # Order not found
-                    self.logger.info(f"Order {order['id']} already cancelled or filled during cleanup")
-                    self.open_orders = [o for o in self.open_orders if o['id'] != order['id']]
-                else:
-                    self.logger.warning(f"WebSocket error during cleanup of order {order['id']}: {e}")
-                    failed_orders.append(order)
+        # Fallback: cancel the remaining orders individually, all at once
+        results = await asyncio.gather(*(self._cleanup_order_websocket(order)
+                                         for order in list(self.open_orders.values())))
+        failed_orders = [order for order in results if order is not None]
         
         # Final fallback: Use REST API for failed orders
         if failed_orders:
@@ -1044,144 +1002,87 @@ class BinanceWebSocketExchange(BaseExchange):
         
         if self.open_orders:
             self.logger.error(f"CRITICAL: Failed to cleanup {len(self.open_orders)} orders - manual intervention may be required!")
-            for order in self.open_orders:
+            for order in self.open_orders.values():
                 self.logger.error(f"Uncancelled order: {order['id']} on {order['symbol']}")
         else:
             self.logger.info("All orders cleaned up successfully")
 
-    async def cleanup_all_open_orders_rest(self):
-        """Query and cancel ALL open orders for this symbol using REST API - comprehensive startup cleanup"""
+    async def _cleanup_order_websocket(self, order: dict) -> dict | None:
+        """Cancel one tracked order via WebSocket during cleanup, returning it if REST should retry"""
         try:
-            from binance.spot import Spot
-            
-            # Create REST client to query all open orders
-            rest_client = Spot(
-                api_key=self.api_key,
-                api_secret=self.secret_key,
-                timeout=10
-            )
-            
-            self.logger.info("Querying all open orders via REST API for comprehensive cleanup...")
-            
-            # Get all open orders for this symbol
-            open_orders = rest_client.get_open_orders(symbol=self.symbol)
-            
-            if not open_orders:
-                self.logger.info("No open orders found via REST API")
-                self.open_orders.clear()  # Clear our tracking list too
-                return
+            # Use WebSocket API for cleanup with shorter timeout
+            async with self.ws_request_semaphore:
+                await asyncio.wait_for(self._cancel_order(order['id']), timeout=5.0)
+            self.logger.info(f"Successfully cancelled order {order['id']} during cleanup via WebSocket")
             
-            self.logger.warning(f"Found {len(open_orders)} open orders via REST API, cancelling all...")
+        except asyncio.TimeoutError:
+            self.logger.warning(f"WebSocket timeout cancelling order {order['id']}, will retry with REST API")
+            return order
+        except ClientError as e:
+            if e.error_code == BINANCE_UNKNOWN_ORDER:
+                self.logger.info(f"Order {order['id']} already cancelled or filled during cleanup")
+                self.open_orders.pop(order['id'], None)
+            else:
+                self.logger.warning(f"WebSocket error during cleanup of order {order['id']}: {e}")
+                return order
+        except Exception as e:
+            self.logger.warning(f"WebSocket error during cleanup of order {order['id']}: {e}")
+            return order
+        return None
+
+    async def cleanup_all_open_orders_rest(self):
+        """Cancel ALL open orders for this symbol using REST API - comprehensive startup cleanup
+        
+        A single DELETE /api/v3/openOrders cancels everything on the symbol, instead of
+        querying open orders and cancelling them one round trip at a time.
+        """
+        try:
+            self.logger.info("Cancelling all open orders via REST API for comprehensive cleanup...")
             
-            cancelled_count = 0
-            for order in open_orders:
-                try:
-                    order_id = str(order['orderId'])
-                    cancel_response = rest_client.cancel_order(
-                        symbol=self.symbol,
-                        orderId=int(order_id)
-                    )
-                    
-                    if cancel_response and 'orderId' in cancel_response:
-                        cancelled_count += 1
-                        self.logger.info(f"REST API cancelled order {order_id}")
-                        
-                        # Add to our tracking list if not already there
-                        if not any(o['id'] == order_id for o in self.open_orders):
-                            self.open_orders.append({
-                                'id': order_id,
-                                'symbol': self.symbol,
-                                'exchange': 'binance'
-                            })
-                    else:
-                        self.logger.error(f"Failed to cancel order {order_id} via REST API")
-                        
-                except Exception as e:
-                    error_msg = str(e)
-                    if "-2011" in error_msg:  # Order not found
-                        self.logger.info(f"Order {order['orderId']} already cancelled or filled")
-                    else:
-                        self.logger.error(f"Error cancelling order {order['orderId']}: {e}")
+            try:
+                cancelled = await asyncio.to_thread(self.rest_client.cancel_open_orders, symbol=self.symbol)
+            except ClientError as e:
+                if e.error_code != BINANCE_UNKNOWN_ORDER:  # Here it means there were no open orders
+                    raise
+                cancelled = []
             
             # Clear our tracking list since we've cancelled everything
             self.open_orders.clear()
-            self.logger.info(f"Comprehensive cleanup complete: {cancelled_count}/{len(open_orders)} orders cancelled")
+            
+            if cancelled:
+                self.logger.warning(f"Comprehensive cleanup complete: {len(cancelled)} open orders cancelled via REST API")
+            else:
+                self.logger.info("No open orders found via REST API")
             
         except Exception as e:
             self.logger.error(f"Error during comprehensive REST cleanup: {e}")
 
     async def _cleanup_orders_rest_fallback(self, failed_orders):
-        """Fallback method to cancel orders using REST API"""
+        """Fallback method to cancel orders using REST API, with the blocking calls overlapped in threads"""
+        self.logger.info(f"Using REST API fallback to cancel {len(failed_orders)} orders")
+        await asyncio.gather(*(self._cleanup_order_rest(order) for order in failed_orders))
+
+    async def _cleanup_order_rest(self, order: dict) -> None:
+        """Cancel one tracked order via the REST client during cleanup"""
         try:
-            from binance.spot import Spot
-            
-            # Create REST client for emergency cleanup
-            rest_client = Spot(
-                api_key=self.api_key,
-                api_secret=self.secret_key,
-                timeout=10
-            )
+            async with self.request_semaphore:
+                cancel_response = await asyncio.to_thread(self.rest_client.cancel_order,
+                                                          symbol=self.symbol, orderId=order['id'])
             
-            self.logger.info(f"Using REST API fallback to cancel {len(failed_orders)} orders")
-            
-            for order in failed_orders[:]:
-                try:
-                    cancel_response = rest_client.cancel_order(
-                        symbol=self.symbol,
-                        orderId=int(order['id'])
-                    )
-                    
-                    if cancel_response and 'orderId' in cancel_response:
-                        self.open_orders = [o for o in self.open_orders if o['id'] != order['id']]
-                        self.logger.info(f"REST API successfully cancelled order {order['id']}")
-                    else:
-                        self.logger.error(f"REST API cancel failed for order {order['id']}: Invalid response")
-                        
-                except Exception as e:
-                    error_msg = str(e)
-                    if "-2011" in error_msg:  # Order not found
-                        self.logger.info(f"Order {order['id']} already cancelled or filled (REST API)")
-                        self.open_orders = [o for o in self.open_orders if o['id'] != order['id']]
-                    else:
-                        self.logger.error(f"REST API cancel failed for order {order['id']}: {e}")
-                        
-        except Exception as e:
-            self.logger.error(f"REST API fallback initialization failed: {e}")
-    
-    def __del__(self):
-        """Destructor to ensure cleanup when object is garbage collected"""
-        try:
-            if hasattr(self, 'open_orders') and self.open_orders:
-                self.logger.warning(f"BinanceWebSocketExchange destructor: {len(self.open_orders)} orders still open, attempting cleanup")
-                
-                # Emergency synchronous cleanup using REST API
-                from binance.spot import Spot
-                rest_client = Spot(
-                    api_key=self.api_key,
-                    api_secret=self.secret_key,
-                    timeout=10
-                )
+            if cancel_response and 'orderId' in cancel_response:
+                self.open_orders.pop(order['id'], None)
+                self.logger.info(f"REST API successfully cancelled order {order['id']}")
+            else:
+                self.logger.error(f"REST API cancel failed for order {order['id']}: Invalid response")
                 
-                for order in self.open_orders[:]:
-                    try:
-                        cancel_response = rest_client.cancel_order(
-                            symbol=self.symbol,
-                            orderId=int(order['id'])
-                        )
-                        
-                        if cancel_response and 'orderId' in cancel_response:
-                            self.open_orders.remove(order)
-                            self.logger.warning(f"Destructor cancelled order {order['id']}")
-                        
-                    except Exception as e:
-                        error_msg = str(e)
-                        if "-2011" in error_msg:  # Order not found
-                            self.open_orders.remove(order)
-                        else:
-                            self.logger.error(f"Destructor cleanup failed for order {order['id']}: {e}")
+        except ClientError as e:
+            if e.error_code == BINANCE_UNKNOWN_ORDER:
+                self.logger.info(f"Order {order['id']} already cancelled or filled (REST API)")
+                self.open_orders.pop(order['id'], None)
+            else:
+                self.logger.error(f"REST API cancel failed for order {order['id']}: {e}")
         except Exception as e:
-            # Avoid exceptions in destructor
-            pass
+            self.logger.error(f"REST API cancel failed for order {order['id']}: {e}")
 
     async def close(self):
         """Close connection and cleanup resources"""
@@ -1215,6 +1116,9 @@ class BinanceWebSocketExchange(BaseExchange):
                 except Exception as e:
                     self.logger.warning(f"Error stopping WebSocket stream client: {e}")
             
+            # Release pooled REST connections
+            self.rest_client.session.close()
+            
             self.is_connected = False
             self.logger.info(f"{self.full_name} closed successfully")
             
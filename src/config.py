@@ -4,10 +4,12 @@ Configuration settings for the exchange performance testing framework
 
 # Test Configuration
 DEFAULT_TEST_DURATION = None  # Unlimited time (None = run until stopped)
-TEST_INTERVAL_MIN = 0.5      # Minimum seconds between tests
-TEST_INTERVAL_MAX = 1.0      # Maximum seconds between tests
+TEST_RATE_HZ = 1.5           # Mean tests per second per exchange (exponentially distributed gaps)
 ORDER_SIZE_BTC = 0.0001      # BTC order size for testing (further reduced to avoid insufficient funds errors)
 MARKET_OFFSET = 0.95         # Place orders at 95% of market price
+PRICE_CACHE_TTL = 5.0        # Seconds before the cached market price is refreshed
+MAX_CONCURRENT_REQUESTS = 16 # Per-exchange cap on in-flight HTTP requests
+MAX_CONCURRENT_WS_REQUESTS = 8 # Per-exchange cap on in-flight WebSocket cleanup cancels
 
 # Exchange-specific Configuration
 BINANCE_CONFIG = {
@@ -22,6 +24,16 @@ BINANCE_CONFIG = {
     'price_precision': 2        # 2 decimal places for spot prices
 }
 
+# Binance order placement errors worth naming in the logs, keyed by API error code
+BINANCE_ORDER_ERRORS = {
+    -1111: "PRECISION ERROR",
+    -2010: "INSUFFICIENT FUNDS",
+    -1013: "FILTER FAILURE",
+}
+
+# Binance error code for cancelling an order that is already filled, cancelled or unknown
+BINANCE_UNKNOWN_ORDER = -2011
+
 HYPERLIQUID_CONFIG = {
     'asset': 'BTC',
     'tick_size': 1.0,           # $1 tick size for BTC
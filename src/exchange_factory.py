@@ -1,4 +1,5 @@
 import os
+import asyncio
 from typing import List
 from .base_exchange import BaseExchange
 from .binance_exchange import BinanceExchange
@@ -20,18 +21,24 @@ class ExchangeFactory:
         binance_secret = os.getenv("BINANCE_SECRET_KEY")
         
         if binance_key and binance_secret:
+            # REST and WebSocket trade the same account, so they share one order lock;
+            # otherwise one's cleanup could cancel the other's order mid-test
+            binance_lock = asyncio.Lock()
+            
             # Create REST API instance
             if ENABLE_REST_API:
                 exchanges.append(BinanceExchange(
                     binance_key, 
-                    binance_secret
+                    binance_secret,
+                    order_lock=binance_lock
                 ))
             
             # Create WebSocket API instance
             if ENABLE_WEBSOCKET_API:
                 exchanges.append(BinanceWebSocketExchange(
                     binance_key,
-                    binance_secret
+                    binance_secret,
+                    order_lock=binance_lock
                 ))
         
         # Hyperliquid exchanges
@@ -39,9 +46,12 @@ class ExchangeFactory:
         hl_private_key = os.getenv("HYPERLIQUID_PRIVATE_KEY")
         
         if hl_address and hl_private_key:
+            # One order lock per wallet, shared by every exchange trading it
+            hyperliquid_lock = asyncio.Lock()
+            
             # Create REST API instance
             if ENABLE_REST_API:
-                exchanges.append(HyperliquidExchange(hl_address, hl_private_key))
+                exchanges.append(HyperliquidExchange(hl_address, hl_private_key, order_lock=hyperliquid_lock))
             
             # Note: Hyperliquid does not support WebSocket order placement
             # WebSocket is only available for market data feeds, not order operations
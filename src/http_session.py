@@ -0,0 +1,30 @@
+import aiohttp
+from typing import Optional
+
+
+# One pooled session per process, so every REST exchange instance shares the
+# keep-alive connections and DNS cache instead of opening its own pool
+_shared_session: Optional[aiohttp.ClientSession] = None
+
+
+def get_shared_session() -> aiohttp.ClientSession:
+    """Get the shared HTTP session, creating it on first use
+
+    Must be called from inside the running event loop the session will be used on.
+    Per-account headers such as API keys are passed per request, not set here.
+    """
+    global _shared_session
+    if _shared_session is None or _shared_session.closed:
+        _shared_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300, keepalive_timeout=75),
+            timeout=aiohttp.ClientTimeout(total=10)
+        )
+    return _shared_session
+
+
+async def close_shared_session() -> None:
+    """Close the shared HTTP session if one is open"""
+    global _shared_session
+    if _shared_session is not None and not _shared_session.closed:
+        await _shared_session.close()
+    _shared_session = None
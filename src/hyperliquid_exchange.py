@@ -1,4 +1,4 @@
-import time
+import asyncio
 import eth_account
 from eth_account.signers.local import LocalAccount
 from hyperliquid.info import Info
@@ -11,8 +11,9 @@ from .config import HYPERLIQUID_CONFIG, ORDER_SIZE_BTC, MARKET_OFFSET
 class HyperliquidExchange(BaseExchange):
     """Hyperliquid REST API implementation"""
     
-    def __init__(self, wallet_address: str, private_key: str, asset: str | None = None):
-        super().__init__("Hyperliquid", APIMode.REST)
+    def __init__(self, wallet_address: str, private_key: str, asset: str | None = None,
+                 order_lock: asyncio.Lock | None = None):
+        super().__init__("Hyperliquid", APIMode.REST, order_lock)
         
         self.logger.info("Initializing Hyperliquid exchange")
         
@@ -36,49 +37,54 @@ class HyperliquidExchange(BaseExchange):
         tick_size = self._get_tick_size(asset)
         return round(price / tick_size) * tick_size
 
+    async def _fetch_price(self) -> float | None:
+        """Get current mid price from the info API"""
+        # The SDK is blocking, so query it off the event loop
+        meta = await asyncio.to_thread(self.info.meta)
+        universe = meta.get('universe', [])
+        
+        for token_info in universe:
+            if token_info.get('name') == self.asset:
+                # Get the mark price (current market price)
+                all_mids = await asyncio.to_thread(self.info.all_mids)
+                if self.asset in all_mids:
+                    return float(all_mids[self.asset])
+        return None
+
+    async def warmup(self) -> None:
+        """Open the order connection and seed the price before timed requests start"""
+        try:
+            # A cheap info query on the exchange client's own session opens the pooled
+            # TLS connection that order and cancel requests reuse
+            await asyncio.to_thread(self.exchange.post, "/info", {"type": "allMids"})
+            await self._ensure_fresh_price()
+            self.logger.info(f"Connection pool warmed up, current price: {self.latest_price}")
+        except Exception as e:
+            self.logger.warning(f"Warmup failed, first samples may include connection setup: {e}")
+
     async def test_order_latency(self) -> None:
         """Test Hyperliquid order placement and cancellation latency"""
         if not self.exchange:
             self.logger.warning("No exchange available for order test")
             return
             
-        # Get current price directly from info API
-        if not self.latest_price:
-            try:
-                self.logger.debug(f"Getting current price for {self.asset}")
-                # Get the current market price
-                meta = self.info.meta()
-                universe = meta.get('universe', [])
-                
-                for token_info in universe:
-                    if token_info.get('name') == self.asset:
-                        # Get the mark price (current market price)
-                        all_mids = self.info.all_mids()
-                        if self.asset in all_mids:
-                            self.latest_price = float(all_mids[self.asset])
-                            self.logger.debug(f"Got current price for {self.asset}: {self.latest_price}")
-                            break
-                
-                if not self.latest_price:
-                    self.logger.error(f"Failed to get current price for {self.asset}")
-                    return
-                    
-            except Exception as e:
-                self.logger.error(f"Error getting current price: {e}")
-                return
+        # Get current market price, refreshed outside the timed region
+        if not await self._ensure_fresh_price():
+            return
         
         # Place order 5% below market to avoid execution
         raw_price = self.latest_price * MARKET_OFFSET
         price = self._round_to_tick_size(raw_price, self.asset)
         
-        self.logger.debug(f"Placing order: {ORDER_SIZE_BTC} {self.asset} at {price}")
+        self.logger.debug("Placing order: %s %s at %s", ORDER_SIZE_BTC, self.asset, price)
         
         self.failure_data.place_order_total += 1
-        start_time = time.time()
         
         try:
-            # Place order
-            result = self.exchange.order(
+            # Place order; the SDK is blocking, so run it off the event loop
+            result, error, place_latency_ns = await asyncio.to_thread(
+                self._timed_call,
+                self.exchange.order,
                 name=self.asset,
                 is_buy=True,
                 sz=ORDER_SIZE_BTC,
@@ -86,16 +92,17 @@ class HyperliquidExchange(BaseExchange):
                 order_type={"limit": {"tif": "Gtc"}},
                 reduce_only=False
             )
-            place_latency = time.time() - start_time
             
-            # Always record total request latency
-            self.latency_data.place_order_total.append(place_latency)
+            # Always record total request latency, timed in the worker thread even on failure
+            self.latency_data.place_order_total.append(place_latency_ns)
+            if error is not None:
+                raise error
             
             if result and result.get("status") == "ok":
                 # Record success-only latency
-                self.latency_data.place_order.append(place_latency)
+                self.latency_data.place_order.append(place_latency_ns)
                 
-                self.logger.debug(f"Order placed successfully in {place_latency:.4f}s")
+                self.logger.debug("Order placed successfully in %.4fs", place_latency_ns / 1e9)
                 
                 # Try to cancel order immediately
                 statuses = result.get("response", {}).get("data", {}).get("statuses", [])
@@ -103,11 +110,11 @@ class HyperliquidExchange(BaseExchange):
                     order_id = statuses[0]["resting"]["oid"]
                     
                     # Track for cleanup
-                    self.open_orders.append({
+                    self.open_orders[order_id] = {
                         'id': order_id,
                         'asset': self.asset,
                         'exchange': 'hyperliquid'
-                    })
+                    }
                     
                     # Cancel order
                     await self._cancel_order(order_id)
@@ -120,39 +127,38 @@ class HyperliquidExchange(BaseExchange):
                 self.logger.error(f"Order placement failed: {error_msg}")
             
         except Exception as e:
-            place_latency = time.time() - start_time
-            # Record total request latency even for exceptions
-            self.latency_data.place_order_total.append(place_latency)
+            # Total latency was already recorded if the call itself raised
             self.failure_data.place_order_failures += 1
-            self.logger.error(f"Unexpected error during order placement: {e}", exc_info=True)
+            self.logger.error(f"Unexpected error during order placement: {e}", exc_info=self.traceback_enabled())
     
     async def _cancel_order(self, order_id: str) -> None:
         """Cancel a specific order and log the result"""
         self.failure_data.cancel_order_total += 1
-        cancel_start_time = time.time()
         
         try:
-            cancel_result = self.exchange.cancel(self.asset, int(order_id))
-            cancel_latency = time.time() - cancel_start_time
+            cancel_result, error, cancel_latency_ns = await asyncio.to_thread(
+                self._timed_call, self.exchange.cancel, self.asset, int(order_id)
+            )
             
-            # Always record total cancel latency
-            self.latency_data.cancel_order_total.append(cancel_latency)
+            # Always record total cancel latency, timed in the worker thread even on failure
+            self.latency_data.cancel_order_total.append(cancel_latency_ns)
+            if error is not None:
+                raise error
             
             if cancel_result and cancel_result.get("status") == "ok":
                 # Record success-only cancel latency
-                self.latency_data.cancel_order.append(cancel_latency)
-                self.open_orders = [o for o in self.open_orders if o['id'] != order_id]
-                self.logger.debug(f"Order {order_id} cancelled successfully in {cancel_latency:.4f}s")
+                self.latency_data.cancel_order.append(cancel_latency_ns)
+                self.open_orders.pop(order_id, None)
+                self.logger.debug("Order %s cancelled successfully in %.4fs", order_id, cancel_latency_ns / 1e9)
             else:
                 self.failure_data.cancel_order_failures += 1
                 error_msg = cancel_result.get("error", "Unknown error") if cancel_result else "No result returned"
                 self.logger.error(f"Order cancellation failed for {order_id}: {error_msg}")
                 
         except Exception as e:
-            cancel_latency = time.time() - cancel_start_time
-            self.latency_data.cancel_order_total.append(cancel_latency)
+            # Total latency was already recorded if the call itself raised
             self.failure_data.cancel_order_failures += 1
-            self.logger.error(f"Error cancelling order {order_id}: {e}", exc_info=True)
+            self.logger.error(f"Error cancelling order {order_id}: {e}", exc_info=self.traceback_enabled())
     
     async def cleanup_open_orders(self):
         """Cancel all open Hyperliquid orders"""
@@ -162,17 +168,28 @@ class HyperliquidExchange(BaseExchange):
         
         self.logger.info(f"Cleaning up {len(self.open_orders)} open orders")
         
-        for order in self.open_orders[:]:
-            try:
-                result = self.exchange.cancel(order['asset'], int(order['id']))
-                if result and result.get("status") == "ok":
-                    self.open_orders.remove(order)
-                    self.logger.info(f"Successfully cancelled order {order['id']} during cleanup")
-                else:
-                    error_msg = result.get("error", "Unknown error") if result else "No result returned"
-                    self.logger.warning(f"Failed to cancel order {order['id']} during cleanup: {error_msg}")
-            except Exception as e:
-                self.logger.error(f"Error during cleanup of order {order['id']}: {e}", exc_info=True)
+        # One signed bulk cancel instead of a request per order; concurrent single
+        # cancels could also collide on the SDK's millisecond nonce
+        orders = list(self.open_orders.values())
+        try:
+            result = await asyncio.to_thread(
+                self.exchange.bulk_cancel,
+                [{"coin": order['asset'], "oid": int(order['id'])} for order in orders]
+            )
+            if result and result.get("status") == "ok":
+                statuses = result.get("response", {}).get("data", {}).get("statuses", [])
+                for order, status in zip(orders, statuses):
+                    if status == "success":
+                        self.open_orders.pop(order['id'], None)
+                        self.logger.info(f"Successfully cancelled order {order['id']} during cleanup")
+                    else:
+                        error_msg = status.get("error", "Unknown error") if isinstance(status, dict) else status
+                        self.logger.warning(f"Failed to cancel order {order['id']} during cleanup: {error_msg}")
+            else:
+                error_msg = result.get("error", "Unknown error") if result else "No result returned"
+                self.logger.warning(f"Failed to cancel {len(orders)} orders during cleanup: {error_msg}")
+        except Exception as e:
+            self.logger.error(f"Error during cleanup of {len(orders)} orders: {e}", exc_info=True)
         
         if self.open_orders:
             self.logger.warning(f"Failed to cleanup {len(self.open_orders)} orders")
@@ -5,7 +5,7 @@ from eth_account.signers.local import LocalAccount
 from hyperliquid.info import Info
 from hyperliquid.exchange import Exchange
 from hyperliquid.utils import constants
-from hyperliquid.utils.types import L2BookMsg
+from hyperliquid.utils.types import BboMsg
 from .base_exchange import BaseExchange, APIMode
 from .config import HYPERLIQUID_CONFIG, ORDER_SIZE_BTC, MARKET_OFFSET
 
@@ -19,8 +19,9 @@ class HyperliquidWebSocketExchange(BaseExchange):
     - Provides the same interface as true WebSocket exchanges
     """
     
-    def __init__(self, wallet_address: str, private_key: str, asset: str | None = None):
-        super().__init__("Hyperliquid", APIMode.WEBSOCKET)
+    def __init__(self, wallet_address: str, private_key: str, asset: str | None = None,
+                 order_lock: asyncio.Lock | None = None):
+        super().__init__("Hyperliquid", APIMode.WEBSOCKET, order_lock)
         
         self.logger.info("Initializing Hyperliquid WebSocket exchange")
         
@@ -33,6 +34,13 @@ class HyperliquidWebSocketExchange(BaseExchange):
         self.subscription_id = None
         self.latest_orderbook_received = asyncio.Event()
         self.orderbook_start_time = None
+        self.loop = None  # Event loop that book updates are handed to
+        self.best_bid = None
+        self.best_ask = None
+        
+        # Top-of-book feed: each frame carries only the best bid and ask rather than
+        # the full l2Book depth, which is all that order pricing needs
+        self.book_subscription = {"type": "bbo", "coin": self.asset}
         
         # Create LocalAccount for signing
         self.account: LocalAccount = eth_account.Account.from_key(private_key)
@@ -48,9 +56,11 @@ class HyperliquidWebSocketExchange(BaseExchange):
         try:
             self.logger.info("Connecting to Hyperliquid WebSocket via SDK")
             
+            # Book updates arrive on the SDK's thread and are handed to this loop
+            self.loop = asyncio.get_running_loop()
+            
             # Subscribe to orderbook updates using the SDK
-            subscription = {"type": "l2Book", "coin": self.asset}
-            self.subscription_id = self.info.subscribe(subscription, self._on_orderbook_update)  # type: ignore
+            self.subscription_id = self.info.subscribe(self.book_subscription, self._on_orderbook_update)  # type: ignore
             
             # Note: Order operations use the Exchange SDK in an async/threaded manner
             # to simulate WebSocket-style behavior
@@ -66,8 +76,7 @@ class HyperliquidWebSocketExchange(BaseExchange):
         """Close WebSocket connection"""
         try:
             if self.subscription_id is not None:
-                subscription = {"type": "l2Book", "coin": self.asset}
-                self.info.unsubscribe(subscription, self.subscription_id)  # type: ignore
+                self.info.unsubscribe(self.book_subscription, self.subscription_id)  # type: ignore
                 self.subscription_id = None
                 
             # Force disconnect WebSocket with timeout
@@ -81,16 +90,30 @@ class HyperliquidWebSocketExchange(BaseExchange):
             self.logger.error(f"Error disconnecting from WebSocket: {e}", exc_info=True)
             self.is_connected = False
 
-    def _on_orderbook_update(self, msg: L2BookMsg) -> None:
-        """Callback for orderbook updates from WebSocket"""
+    def _on_orderbook_update(self, msg: BboMsg) -> None:
+        """Callback for top-of-book updates from WebSocket
+        
+        Runs on the SDK's WebSocket thread, so the parsed best bid and ask are
+        handed to the event loop rather than touching loop state from here.
+        """
         try:
-            if msg["channel"] == "l2Book" and "data" in msg:
-                orderbook_data = msg["data"]
-                if orderbook_data["coin"] == self.asset:
-                    self.latest_orderbook_received.set()
-                    self.logger.debug(f"Received orderbook update for {self.asset}")
+            if msg["channel"] == "bbo" and "data" in msg:
+                book_data = msg["data"]
+                if book_data["coin"] == self.asset:
+                    bid, ask = book_data["bbo"]
+                    if bid and ask and self.loop is not None:
+                        self.loop.call_soon_threadsafe(self._apply_orderbook_price, float(bid["px"]), float(ask["px"]))
+                    self.logger.debug("Received orderbook update for %s", self.asset)
         except Exception as e:
-            self.logger.error(f"Error processing orderbook update: {e}", exc_info=True)
+            self.logger.error(f"Error processing orderbook update: {e}", exc_info=self.traceback_enabled())
+
+    def _apply_orderbook_price(self, best_bid: float, best_ask: float) -> None:
+        """Update the cached best prices and mid from the streamed book on the event loop"""
+        self.best_bid = best_bid
+        self.best_ask = best_ask
+        self.latest_price = (best_bid + best_ask) * 0.5
+        self.latest_price_time = time.monotonic()
+        self.latest_orderbook_received.set()
 
     def _get_tick_size(self, asset: str = "BTC") -> float:
         """Get the correct tick size for Hyperliquid assets"""
@@ -103,48 +126,61 @@ class HyperliquidWebSocketExchange(BaseExchange):
         tick_size = self._get_tick_size(asset)
         return round(price / tick_size) * tick_size
 
+    async def _fetch_price(self) -> float | None:
+        """Get current mid price from the info API"""
+        # The SDK is blocking, so query it off the event loop
+        meta = await asyncio.to_thread(self.info.meta)
+        universe = meta.get('universe', [])
+        
+        for token_info in universe:
+            if token_info.get('name') == self.asset:
+                # Get the mark price (current market price)
+                all_mids = await asyncio.to_thread(self.info.all_mids)
+                if self.asset in all_mids:
+                    return float(all_mids[self.asset])
+        return None
+
+    async def warmup(self) -> None:
+        """Subscribe to the book and open the order connection before timed requests start"""
+        if not self.is_connected:
+            await self.connect()
+        
+        # Let the first book update seed the price so tests start from the stream
+        try:
+            await asyncio.wait_for(self.latest_orderbook_received.wait(), timeout=5.0)
+        except asyncio.TimeoutError:
+            self.logger.warning("No orderbook update received during warmup, falling back to REST prices")
+        
+        try:
+            # A cheap info query on the exchange client's own session opens the pooled
+            # TLS connection that order and cancel requests reuse
+            await asyncio.to_thread(self.exchange.post, "/info", {"type": "allMids"})
+            await self._ensure_fresh_price()
+            self.logger.info(f"Connection pool warmed up, current price: {self.latest_price}")
+        except Exception as e:
+            self.logger.warning(f"Warmup failed, first samples may include connection setup: {e}")
+
     async def test_order_latency(self) -> None:
         """Test order placement via WebSocket-style (using Exchange SDK with async interface)"""
         
-        if not self.latest_price:
-            # Get current price directly from info API
-            try:
-                self.logger.debug(f"Getting current price for {self.asset}")
-                # Get the current market price
-                meta = self.info.meta()
-                universe = meta.get('universe', [])
-                
-                for token_info in universe:
-                    if token_info.get('name') == self.asset:
-                        # Get the mark price (current market price)
-                        all_mids = self.info.all_mids()
-                        if self.asset in all_mids:
-                            self.latest_price = float(all_mids[self.asset])
-                            self.logger.debug(f"Got current price for {self.asset}: {self.latest_price}")
-                            break
-                
-                if not self.latest_price:
-                    self.logger.error(f"Failed to get current price for {self.asset}")
-                    return
-                    
-            except Exception as e:
-                self.logger.error(f"Error getting current price: {e}")
-                return
+        # The streamed book keeps the cached price fresh; REST is only the fallback
+        if not await self._ensure_fresh_price():
+            return
         
         # Place order 5% below market to avoid execution
         raw_price = self.latest_price * MARKET_OFFSET
         price = self._round_to_tick_size(raw_price, self.asset)
         
-        self.logger.debug(f"Placing order via WebSocket-style: {ORDER_SIZE_BTC} {self.asset} at {price}")
+        self.logger.debug("Placing order via WebSocket-style: %s %s at %s", ORDER_SIZE_BTC, self.asset, price)
         
         self.failure_data.place_order_total += 1
-        start_time = time.time()
         
         try:
-            # Direct SDK call - same as REST but in async context
             # Note: Since Hyperliquid doesn't support true WebSocket orders,
-            # we use the SDK directly for optimal performance
-            result = self.exchange.order(
+            # we use the SDK, run in a worker thread because it blocks
+            result, error, place_latency_ns = await asyncio.to_thread(
+                self._timed_call,
+                self.exchange.order,
                 name=self.asset,
                 is_buy=True,
                 sz=ORDER_SIZE_BTC,
@@ -153,16 +189,16 @@ class HyperliquidWebSocketExchange(BaseExchange):
                 reduce_only=False
             )
             
-            place_latency = time.time() - start_time
-            
-            # Always record total request latency
-            self.latency_data.place_order_total.append(place_latency)
+            # Always record total request latency, timed in the worker thread even on failure
+            self.latency_data.place_order_total.append(place_latency_ns)
+            if error is not None:
+                raise error
             
             if result and result.get("status") == "ok":
                 # Record success-only latency
-                self.latency_data.place_order.append(place_latency)
+                self.latency_data.place_order.append(place_latency_ns)
                 
-                self.logger.debug(f"Hyperliquid WebSocket-style order placed successfully in {place_latency:.4f}s")
+                self.logger.debug("Hyperliquid WebSocket-style order placed successfully in %.4fs", place_latency_ns / 1e9)
                 
                 # Try to cancel order immediately if it's resting
                 statuses = result.get("response", {}).get("data", {}).get("statuses", [])
@@ -170,11 +206,11 @@ class HyperliquidWebSocketExchange(BaseExchange):
                     order_id = statuses[0]["resting"]["oid"]
                     
                     # Track for cleanup
-                    self.open_orders.append({
+                    self.open_orders[order_id] = {
                         'id': order_id,
                         'asset': self.asset,
                         'exchange': 'hyperliquid-websocket'
-                    })
+                    }
                     
                     # Cancel order via WebSocket-style
                     await self._cancel_order_websocket(order_id)
@@ -187,46 +223,43 @@ class HyperliquidWebSocketExchange(BaseExchange):
                 self.logger.error(f"Hyperliquid WebSocket-style order placement failed: {error_msg}")
             
         except Exception as e:
-            place_latency = time.time() - start_time
-            # Record total request latency even for exceptions
-            self.latency_data.place_order_total.append(place_latency)
+            # Total latency was already recorded if the call itself raised
             self.failure_data.place_order_failures += 1
-            self.logger.error(f"Unexpected error during Hyperliquid WebSocket-style order placement: {e}", exc_info=True)
+            self.logger.error(f"Unexpected error during Hyperliquid WebSocket-style order placement: {e}", exc_info=self.traceback_enabled())
 
     async def _cancel_order_websocket(self, order_id: str) -> None:
         """Cancel a specific order via WebSocket-style and log the result"""
         self.failure_data.cancel_order_total += 1
-        cancel_start_time = time.time()
         
         try:
-            # Direct SDK call - same as REST but in async context
             # Note: Since Hyperliquid doesn't support true WebSocket orders,
-            # we use the SDK directly for optimal performance
-            cancel_result = self.exchange.cancel(
+            # we use the SDK, run in a worker thread because it blocks
+            cancel_result, error, cancel_latency_ns = await asyncio.to_thread(
+                self._timed_call,
+                self.exchange.cancel,
                 self.asset,
                 int(order_id)
             )
             
-            cancel_latency = time.time() - cancel_start_time
-            
-            # Always record total cancel latency
-            self.latency_data.cancel_order_total.append(cancel_latency)
+            # Always record total cancel latency, timed in the worker thread even on failure
+            self.latency_data.cancel_order_total.append(cancel_latency_ns)
+            if error is not None:
+                raise error
             
             if cancel_result and cancel_result.get("status") == "ok":
                 # Record success-only cancel latency
-                self.latency_data.cancel_order.append(cancel_latency)
-                self.open_orders = [o for o in self.open_orders if o['id'] != order_id]
-                self.logger.debug(f"Hyperliquid WebSocket-style order {order_id} cancelled successfully in {cancel_latency:.4f}s")
+                self.latency_data.cancel_order.append(cancel_latency_ns)
+                self.open_orders.pop(order_id, None)
+                self.logger.debug("Hyperliquid WebSocket-style order %s cancelled successfully in %.4fs", order_id, cancel_latency_ns / 1e9)
             else:
                 self.failure_data.cancel_order_failures += 1
                 error_msg = cancel_result.get("error", "Unknown error") if cancel_result else "No result returned"
                 self.logger.error(f"Hyperliquid WebSocket-style order cancellation failed for {order_id}: {error_msg}")
                 
         except Exception as e:
-            cancel_latency = time.time() - cancel_start_time
-            self.latency_data.cancel_order_total.append(cancel_latency)
+            # Total latency was already recorded if the call itself raised
             self.failure_data.cancel_order_failures += 1
-            self.logger.error(f"Error cancelling Hyperliquid WebSocket-style order {order_id}: {e}", exc_info=True)
+            self.logger.error(f"Error cancelling Hyperliquid WebSocket-style order {order_id}: {e}", exc_info=self.traceback_enabled())
 
     async def cleanup_open_orders(self):
         """Cancel all open Hyperliquid orders"""
@@ -237,17 +270,28 @@ class HyperliquidWebSocketExchange(BaseExchange):
         
         self.logger.info(f"Cleaning up {len(self.open_orders)} open Hyperliquid orders")
         
-        for order in self.open_orders[:]:
-            try:
-                result = self.exchange.cancel(order['asset'], int(order['id']))
-                if result and result.get("status") == "ok":
-                    self.open_orders.remove(order)
-                    self.logger.info(f"Successfully cancelled Hyperliquid order {order['id']} during cleanup")
-                else:
-                    error_msg = result.get("error", "Unknown error") if result else "No result returned"
-                    self.logger.warning(f"Failed to cancel Hyperliquid order {order['id']} during cleanup: {error_msg}")
-            except Exception as e:
-                self.logger.error(f"Error during cleanup of Hyperliquid order {order['id']}: {e}", exc_info=True)
+        # One signed bulk cancel instead of a request per order; concurrent single
+        # cancels could also collide on the SDK's millisecond nonce
+        orders = list(self.open_orders.values())
+        try:
+            result = await asyncio.to_thread(
+                self.exchange.bulk_cancel,
+                [{"coin": order['asset'], "oid": int(order['id'])} for order in orders]
+            )
+            if result and result.get("status") == "ok":
+                statuses = result.get("response", {}).get("data", {}).get("statuses", [])
+                for order, status in zip(orders, statuses):
+                    if status == "success":
+                        self.open_orders.pop(order['id'], None)
+                        self.logger.info(f"Successfully cancelled Hyperliquid order {order['id']} during cleanup")
+                    else:
+                        error_msg = status.get("error", "Unknown error") if isinstance(status, dict) else status
+                        self.logger.warning(f"Failed to cancel Hyperliquid order {order['id']} during cleanup: {error_msg}")
+            else:
+                error_msg = result.get("error", "Unknown error") if result else "No result returned"
+                self.logger.warning(f"Failed to cancel {len(orders)} Hyperliquid orders during cleanup: {error_msg}")
+        except Exception as e:
+            self.logger.error(f"Error during cleanup of {len(orders)} Hyperliquid orders: {e}", exc_info=True)
         
         await self.disconnect()
         
@@ -1,4 +1,5 @@
-from typing import List
+import math
+from array import array
 from dataclasses import dataclass, field
 
 
@@ -19,13 +20,62 @@ class FailureData:
         return (self.cancel_order_failures / max(self.cancel_order_total, 1)) * 100
 
 
+@dataclass
+class LatencySeries:
+    """Latency samples in integer nanoseconds with running aggregates
+    
+    Samples are kept in a compact int64 array (8 bytes each) so long-running
+    tests stay small in memory, while count/min/max/total and the Welford
+    variance accumulators are updated on every append so the live display can
+    read them without scanning the samples.
+    """
+    samples: array = field(default_factory=lambda: array('q'))
+    count: int = 0
+    total: int = 0
+    min: int | None = None
+    max: int | None = None
+    _running_mean: float = field(default=0.0, repr=False)
+    _m2: float = field(default=0.0, repr=False)
+    
+    def append(self, value_ns: int) -> None:
+        """Record a latency sample"""
+        self.samples.append(value_ns)
+        self.count += 1
+        self.total += value_ns
+        if self.min is None or value_ns < self.min:
+            self.min = value_ns
+        if self.max is None or value_ns > self.max:
+            self.max = value_ns
+        # Welford's update keeps the variance numerically stable in one pass
+        delta = value_ns - self._running_mean
+        self._running_mean += delta / self.count
+        self._m2 += delta * (value_ns - self._running_mean)
+    
+    @property
+    def mean(self) -> float | None:
+        """Mean latency in nanoseconds"""
+        return self.total / self.count if self.count else None
+    
+    @property
+    def std_dev(self) -> float | None:
+        """Sample standard deviation in nanoseconds"""
+        if not self.count:
+            return None
+        if self.count < 2:
+            return 0.0
+        return math.sqrt(self._m2 / (self.count - 1))
+    
+    def __len__(self) -> int:
+        return self.count
+
+
 @dataclass
 class LatencyData:
-    """Data class to store latency measurements"""
+    """Data class to store latency measurements in integer nanoseconds"""
     # Success-only latencies (current behavior)
-    place_order: List[float] = field(default_factory=list)
-    cancel_order: List[float] = field(default_factory=list)
+    place_order: LatencySeries = field(default_factory=LatencySeries)
+    cancel_order: LatencySeries = field(default_factory=LatencySeries)
     
     # Total request latencies (including failures)
-    place_order_total: List[float] = field(default_factory=list)
-    cancel_order_total: List[float] = field(default_factory=list)
+    place_order_total: LatencySeries = field(default_factory=LatencySeries)
+    cancel_order_total: LatencySeries = field(default_factory=LatencySeries)
@@ -1,8 +1,8 @@
 import asyncio
+import gc
 import time
 import random
 import signal
-import statistics
 import logging
 import os
 from typing import List
@@ -10,15 +10,18 @@ from rich.live import Live
 from rich.table import Table
 from rich.console import Console
 from .base_exchange import BaseExchange
+from .models import LatencySeries
 from .exchange_factory import ExchangeFactory
-from .config import DEFAULT_TEST_DURATION, TEST_INTERVAL_MIN, TEST_INTERVAL_MAX, REFRESH_RATE, DECIMAL_PLACES
+from .http_session import close_shared_session
+from .config import DEFAULT_TEST_DURATION, TEST_RATE_HZ, REFRESH_RATE, DECIMAL_PLACES
 from .logger import setup_logging, get_logger
 
 
 class PerformanceTester:
     """Main performance testing class"""
     
-    def __init__(self, duration_seconds: int | None = None, force_compatibility_mode: bool = False):
+    def __init__(self, duration_seconds: int | None = None, force_compatibility_mode: bool = False,
+                 rate_hz: float | None = None):
         # Setup logging first
         setup_logging()
         self.logger = get_logger("performance_tester")
@@ -26,9 +29,16 @@ class PerformanceTester:
         self.duration_seconds = duration_seconds if duration_seconds is not None else DEFAULT_TEST_DURATION
         self.exchanges: List[BaseExchange] = []
         self.console = Console()
-        self.running = True
+        self.stop_event: asyncio.Event | None = None
         self.force_compatibility_mode = force_compatibility_mode
         
+        # Each exchange starts tests as a Poisson process at rate_hz
+        self.rate_hz = rate_hz if rate_hz is not None else TEST_RATE_HZ
+        self._rng = random.Random()
+        
+        # Order statistics per series, reused until the series gets a new sample
+        self._stats_cache: dict[int, tuple[int, dict]] = {}
+        
         # Detect terminal environment for compatibility
         self._detect_terminal_environment()
         
@@ -39,13 +49,11 @@ class PerformanceTester:
                 self.log_file_name = handler.baseFilename
                 break
         
-        self.logger.info(f"Initializing performance tester with duration: {self.duration_seconds}")
+        self.logger.info(f"Initializing performance tester with duration: {self.duration_seconds}, "
+                         f"rate: {self.rate_hz}Hz")
         
         # Initialize exchanges
         self._initialize_exchanges()
-        
-        # Setup signal handlers for graceful shutdown
-        self._setup_signal_handlers()
     
     def _detect_terminal_environment(self):
         """Detect terminal environment and adjust settings for compatibility"""
@@ -80,13 +88,29 @@ class PerformanceTester:
             self.effective_refresh_rate = REFRESH_RATE
     
     def _setup_signal_handlers(self):
-        """Setup signal handlers for graceful shutdown"""
-        def signal_handler(signum, frame):
+        """Setup signal handlers that set the stop event for graceful shutdown"""
+        loop = asyncio.get_running_loop()
+        
+        def request_stop(signum):
             self.logger.info(f"Received signal {signum}, initiating graceful shutdown")
-            self.running = False
+            self.stop_event.set()
         
-        signal.signal(signal.SIGINT, signal_handler)
-        signal.signal(signal.SIGTERM, signal_handler)
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(signum, request_stop, signum)
+            except NotImplementedError:
+                # Windows event loops don't support add_signal_handler; wake the loop from
+                # the plain handler so a pending wait on the stop event returns promptly
+                signal.signal(signum, lambda signum, frame: loop.call_soon_threadsafe(request_stop, signum))
+    
+    def _remove_signal_handlers(self):
+        """Remove the event loop signal handlers installed for the test run"""
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.remove_signal_handler(signum)
+            except NotImplementedError:
+                signal.signal(signum, signal.default_int_handler if signum == signal.SIGINT else signal.SIG_DFL)
     
     async def cleanup_all_orders(self):
         """Cleanup all open orders from all exchanges"""
@@ -98,7 +122,7 @@ class PerformanceTester:
         
         for exchange in self.exchanges:
             if exchange.open_orders:
-                cleanup_tasks.append(exchange.cleanup_open_orders())
+                cleanup_tasks.append(self._cleanup_exchange_orders(exchange))
         
         if cleanup_tasks:
             try:
@@ -107,6 +131,46 @@ class PerformanceTester:
             except Exception as e:
                 self.logger.error(f"Error during order cleanup: {e}", exc_info=True)
     
+    async def _cleanup_exchange_orders(self, exchange: BaseExchange):
+        """Cancel an exchange's open orders once no test is using its account"""
+        async with exchange.order_lock:
+            await exchange.cleanup_open_orders()
+    
+    async def _run_exchange_test(self, exchange: BaseExchange):
+        """Run one order latency test, never overlapping other orders on the same account"""
+        async with exchange.order_lock:
+            await exchange.test_order_latency()
+    
+    async def _probe_loop(self, exchange: BaseExchange):
+        """Run an exchange's order latency tests until the stop event is set
+        
+        Loops for different exchanges run concurrently. Exchanges on the same
+        account take turns through their shared order lock, because a test's
+        cleanup may cancel every order on the symbol.
+        """
+        while not self.stop_event.is_set():
+            try:
+                await self._run_exchange_test(exchange)
+            except Exception as e:
+                self.logger.error(f"Test function {exchange.name}.test_order_latency failed: {e}", exc_info=exchange.traceback_enabled())
+            
+            # Wait an exponentially distributed gap so tests arrive as a Poisson
+            # process and don't phase-lock with periodic server-side behaviour;
+            # a stop request ends the wait immediately
+            try:
+                await asyncio.wait_for(self.stop_event.wait(), timeout=self._rng.expovariate(self.rate_hz))
+            except asyncio.TimeoutError:
+                pass
+    
+    async def warmup_exchanges(self):
+        """Warm up connections on all exchanges before timing starts"""
+        self.logger.info("Warming up exchange connections")
+        results = await asyncio.gather(*(exchange.warmup() for exchange in self.exchanges),
+                                       return_exceptions=True)
+        for exchange, result in zip(self.exchanges, results):
+            if isinstance(result, Exception):
+                self.logger.warning(f"Warmup failed for {exchange.full_name}: {result}")
+    
     def _initialize_exchanges(self):
         """Initialize exchange instances using factory"""
         self.exchanges = ExchangeFactory.create_exchanges()
@@ -125,9 +189,9 @@ class PerformanceTester:
         else:
             return f"[red]{rate:.1f}%[/red]"
     
-    def _calculate_stats(self, latencies: List[float]) -> dict:
-        """Calculate comprehensive statistics for latency data"""
-        if not latencies:
+    def _calculate_stats(self, series: LatencySeries) -> dict:
+        """Calculate comprehensive statistics for latency data in nanoseconds"""
+        if not series.count:
             return {
                 'count': 0,
                 'min': None,
@@ -140,26 +204,36 @@ class PerformanceTester:
                 'p99': None
             }
         
-        sorted_latencies = sorted(latencies)
-        n = len(latencies)
+        cached = self._stats_cache.get(id(series))
+        if cached is not None and cached[0] == series.count:
+            return cached[1]
+        
+        # Count, extremes, mean and deviation are maintained on append; only the
+        # order statistics need the samples, so sort them once
+        sorted_latencies = sorted(series.samples)
+        n = series.count
+        mid = n // 2
+        median = sorted_latencies[mid] if n % 2 else (sorted_latencies[mid - 1] + sorted_latencies[mid]) / 2
         
-        return {
+        stats = {
             'count': n,
-            'min': min(latencies),
-            'max': max(latencies),
-            'mean': statistics.mean(latencies),
-            'median': statistics.median(latencies),
-            'std_dev': statistics.stdev(latencies) if n > 1 else 0.0,
-            'p50': statistics.median(latencies),
+            'min': series.min,
+            'max': series.max,
+            'mean': series.mean,
+            'median': median,
+            'std_dev': series.std_dev,
+            'p50': median,
             'p95': sorted_latencies[int(0.95 * n)] if n > 0 else None,
             'p99': sorted_latencies[int(0.99 * n)] if n > 0 else None
         }
+        self._stats_cache[id(series)] = (n, stats)
+        return stats
     
-    def _format_stat_value(self, value: float | None) -> str:
-        """Format a statistical value for display"""
-        if value is None:
+    def _format_stat_value(self, value_ns: float | None) -> str:
+        """Format a statistical value in nanoseconds for display in seconds"""
+        if value_ns is None:
             return "-"
-        return f"{value:.{DECIMAL_PLACES}f}"
+        return f"{value_ns * 1e-9:.{DECIMAL_PLACES}f}"
 
     def generate_stats_table(self) -> Table:
         """Generate expanded hybrid statistics table for display"""
@@ -329,8 +403,40 @@ class PerformanceTester:
             record.created = time.time()
             file_handler.emit(record)
 
-    async def run_test(self):
-        """Run the performance test"""
+    def _display_state(self) -> tuple:
+        """Sample and failure counts behind every cell of the statistics table"""
+        state = []
+        for exchange in self.exchanges:
+            latency, failures = exchange.latency_data, exchange.failure_data
+            state.extend((latency.place_order.count, latency.place_order_total.count,
+                          latency.cancel_order.count, latency.cancel_order_total.count,
+                          failures.place_order_failures, failures.place_order_total,
+                          failures.cancel_order_failures, failures.cancel_order_total))
+        return tuple(state)
+    
+    async def _refresh_display(self, live: Live):
+        """Periodically rebuild the statistics table for the live display
+        
+        The table is only rebuilt when a count has changed since the last
+        frame; at the default test rate most ticks have nothing new to show.
+        """
+        update_interval = 1.0 / self.effective_refresh_rate
+        last_state = self._display_state()
+        
+        while True:
+            await asyncio.sleep(update_interval)
+            state = self._display_state()
+            if state == last_state:
+                continue
+            last_state = state
+            live.update(self.generate_stats_table())
+            if self.is_remote_terminal:
+                live.refresh()  # Manual refresh for remote terminals
+    
+    async def run_test(self, stop_event: asyncio.Event | None = None):
+        """Run the performance test until the duration elapses or stop_event is set"""
+        self.stop_event = stop_event if stop_event is not None else asyncio.Event()
+        
         if not self.exchanges:
             self.console.print("[red]No exchanges configured. Please check your .env file.[/red]")
             return
@@ -340,20 +446,20 @@ class PerformanceTester:
         else:
             self.console.print(f"[green]Starting performance test for {self.duration_seconds} seconds...[/green]")
         
-        # Small delay to let the start message be seen
-        await asyncio.sleep(1)
+        # Signals set the stop event so the probe loops exit without polling a flag
+        self._setup_signal_handlers()
+        
+        # Establish connections up front so handshakes don't pollute the first samples
+        await self.warmup_exchanges()
         
-        start_time = time.time()
+        # Move everything allocated during setup out of the collector's view, so
+        # collections during the run only traverse objects created by the tests
+        gc.collect()
+        gc.freeze()
         
-        # Test functions for each exchange
-        test_functions = []
-        for exchange in self.exchanges:
-            test_functions.extend([
-                exchange.test_order_latency,
-                exchange.test_order_latency,  # Test order placement more frequently
-            ])
+        start_time = time.monotonic()
         
-        self.logger.debug(f"Test functions setup: {[f'{func.__self__.name}.{func.__name__}' for func in test_functions]}")
+        self.logger.debug("Probe loops setup: %s", [f'{exchange.name}.test_order_latency' for exchange in self.exchanges])
         
         try:
             # Don't clear screen for remote terminals to avoid flickering
@@ -381,41 +487,35 @@ class PerformanceTester:
             
             # Use Rich Live display
             with Live(self.generate_stats_table(), **live_config) as live:
-                last_update = time.time()
-                update_interval = 1.0 / self.effective_refresh_rate
+                # Redraw the table from its own task so rendering never delays a test
+                display_task = asyncio.create_task(self._refresh_display(live))
                 
-                while self.running:
-                    # Check if we should stop based on duration (if not unlimited)
-                    if self.duration_seconds is not None and (time.time() - start_time >= self.duration_seconds):
-                        break
-                        
-                    # Randomly select a test function
-                    test_func = random.choice(test_functions)
-                    
+                # Each exchange probes from its own loop, so a slow exchange never holds up the others;
+                # exchanges sharing an account still serialize on its order lock
+                probe_tasks = [asyncio.create_task(self._probe_loop(exchange)) for exchange in self.exchanges]
+                
+                try:
+                    # Run until the duration elapses (if not unlimited) or a stop is requested
                     try:
-                        self.logger.debug(f"Running test function: {test_func.__self__.name}.{test_func.__name__}")
-                        await test_func()
-                        
-                        # Update the live display with controlled timing for remote terminals
-                        current_time = time.time()
-                        if not self.is_remote_terminal or (current_time - last_update >= update_interval):
-                            live.update(self.generate_stats_table())
-                            if self.is_remote_terminal:
-                                live.refresh()  # Manual refresh for remote terminals
-                            last_update = current_time
-                            
-                    except Exception as e:
-                        self.logger.error(f"Test function {test_func.__self__.name}.{test_func.__name__} failed: {e}", exc_info=True)
+                        await asyncio.wait_for(self.stop_event.wait(), timeout=self.duration_seconds)
+                    except asyncio.TimeoutError:
+                        pass
                     
-                    # Wait before next test
-                    await asyncio.sleep(random.uniform(TEST_INTERVAL_MIN, TEST_INTERVAL_MAX))
+                    # Let in-flight tests finish so their orders are cancelled normally
+                    self.stop_event.set()
+                    await asyncio.gather(*probe_tasks, return_exceptions=True)
+                finally:
+                    for task in probe_tasks:
+                        task.cancel()
+                    display_task.cancel()
+                    await asyncio.gather(*probe_tasks, display_task, return_exceptions=True)
 
             # Show final table permanently after Live context ends
             final_table = self.generate_stats_table()
             self.console.print(final_table)
             
             # When stopping - show completion message below the final table
-            runtime = time.time() - start_time
+            runtime = time.monotonic() - start_time
             
             # Log final statistics summary to file only (not console)
             self._log_to_file_only(f"Performance test completed in {runtime:.2f} seconds")
@@ -428,22 +528,22 @@ class PerformanceTester:
             print()
         
         finally:
+            # Hand the setup objects back to the collector so teardown can free them
+            gc.unfreeze()
             # Always cleanup orders before exiting
             await self.cleanup_all_orders()
             # Close all exchange connections
             await self.close_all_exchanges()
+            self._remove_signal_handlers()
 
     async def close_all_exchanges(self):
         """Close all exchange connections"""
-        close_tasks = []
-        
-        for exchange in self.exchanges:
-            if hasattr(exchange, 'close') and callable(getattr(exchange, 'close')):
-                close_tasks.append(self._safe_close_exchange(exchange))
+        close_tasks = [self._safe_close_exchange(exchange) for exchange in self.exchanges]
         
         if close_tasks:
             try:
                 await asyncio.gather(*close_tasks, return_exceptions=True)
+                await close_shared_session()
                 self.logger.info("All exchange connections closed")
             except Exception as e:
                 self.logger.error(f"Error closing exchanges: {e}", exc_info=True)